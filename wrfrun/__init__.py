@@ -3,6 +3,22 @@ wrfrun
 ######
 """
 
-from . import core, data, extension, model, plot, res, run, scheduler, utils, workspace
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import core, data, extension, model, plot, res, run, scheduler, utils, workspace
+
+# submodules are imported on the first access,
+# so commands like ``wrfrun init`` don't need to load model, plot and data code.
+_SUBMODULES = ("core", "data", "extension", "model", "plot", "res", "run", "scheduler", "utils", "workspace")
+
+
+def __getattr__(name: str):
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    return import_module(f".{name}", __name__)
+
 
 __all__ = ["core", "data", "extension", "model", "plot", "res", "run", "scheduler", "utils", "workspace"]
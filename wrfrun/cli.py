@@ -15,45 +15,97 @@ After installing ``wrfrun``, you can use command ``wrfrun`` to create a simulati
 Get more information by running ``wrfrun --help``.
 """
 
-import argparse
 import sys
 from os import listdir, makedirs
 from os.path import abspath, dirname, exists
 from shutil import copyfile
+from typing import TYPE_CHECKING
 
-import tomli
-import tomli_w
-
-from .core import WRFRunConfig
-from .log import logger
-from .res import (
-    CONFIG_MAIN_TOML_TEMPLATE,
-    CONFIG_PALM_TOML_TEMPLATE,
-    CONFIG_ROMS_TOML_TEMPLATE,
-    CONFIG_WRF_TOML_TEMPLATE,
-    GITIGNORE_RULES,
-    _register_res_uri,
-)
+if TYPE_CHECKING:
+    from .core import WRFRunConfig
 
+# names of resource variables in ``wrfrun.res``.
+# the heavy ``wrfrun`` modules are imported only when a subcommand really needs them.
 MODEL_MAP = {
-    "wrf": CONFIG_WRF_TOML_TEMPLATE,
-    "palm": CONFIG_PALM_TOML_TEMPLATE,
-    "roms": CONFIG_ROMS_TOML_TEMPLATE,
+    "wrf": "CONFIG_WRF_TOML_TEMPLATE",
+    "palm": "CONFIG_PALM_TOML_TEMPLATE",
+    "roms": "CONFIG_ROMS_TOML_TEMPLATE",
 }
 
-# need some mannual calls to make cli work without a config file.
-wrfrun_config = WRFRunConfig("./.wrfrun")
-_register_res_uri(wrfrun_config)
+MAIN_HELP = """usage: wrfrun [-h] {init,model} ...
+
+Subcommands:
+  Valid Subcommands
 
+  {init,model}  Subcommands
+    init        Initialize a wrfrun project.
+    model       Manage models used by wrfrun project.
+
+options:
+  -h, --help    show this help message and exit
+"""
+
+INIT_HELP = """usage: wrfrun init [-h] [-n NAME] [--models [{wrf,palm} ...]]
+
+options:
+  -h, --help            show this help message and exit
+  -n NAME, --name NAME  Name of the wrfrun project.
+  --models [{wrf,palm} ...]
+                        List of models to use.
+"""
+
+MODEL_HELP = """usage: wrfrun model [-h] [-c CONFIG] -a {wrf,palm,roms} [{wrf,palm,roms} ...]
+
+options:
+  -h, --help            show this help message and exit
+  -c CONFIG, --config CONFIG
+                        Path of the main config file.
+  -a {wrf,palm,roms} [{wrf,palm,roms} ...], --add {wrf,palm,roms} [{wrf,palm,roms} ...]
+                        Add models to the project.
+"""
+
+
+def _get_wrfrun_config() -> "WRFRunConfig":
+    """
+    Create a ``WRFRunConfig`` instance which can parse resource URIs.
 
-def _entry_init(args: argparse.Namespace):
+    :return: ``WRFRunConfig`` instance.
+    :rtype: WRFRunConfig
+    """
+    from .core import WRFRunConfig
+    from .res import _register_res_uri
+
+    # need some mannual calls to make cli work without a config file.
+    wrfrun_config = WRFRunConfig("./.wrfrun")
+    _register_res_uri(wrfrun_config)
+
+    return wrfrun_config
+
+
+def _get_template_path(wrfrun_config: "WRFRunConfig", name: str) -> str:
+    """
+    Get the real path of a resource template file.
+
+    :param wrfrun_config: ``WRFRunConfig`` instance.
+    :type wrfrun_config: WRFRunConfig
+    :param name: Variable name of the resource in ``wrfrun.res``.
+    :type name: str
+    :return: Real file path.
+    :rtype: str
+    """
+    from . import res
+
+    return wrfrun_config.parse_resource_uri(getattr(res, name))
+
+
+def _entry_init(configs: dict):
     """
     Initialize a wrfrun project.
 
-    :param args: Arguments namespace.
-    :type args: argparse.Namespace
+    :param configs: Parsed arguments.
+    :type configs: dict
     """
-    configs = vars(args)
+    from .log import logger
 
     project_name = configs["name"]
     models = configs["models"]
@@ -63,7 +115,7 @@ def _entry_init(args: argparse.Namespace):
 
     if exists(project_name):
         # we need to check if this directory isn't empty.
-        files = listdir()
+        files = listdir(project_name)
         # exclude:
         exclude_target = [
             ".venv",
@@ -82,21 +134,23 @@ def _entry_init(args: argparse.Namespace):
             logger.error(f"[CLI] {project_name} isn't empty, choose an empty directory, or backup and delete your files first.")
             exit(1)
 
-    makedirs(f"{project_name}/configs")
-    makedirs(f"{project_name}/data")
+    # these directories may exist already, which is allowed by the check above.
+    makedirs(f"{project_name}/configs", exist_ok=True)
+    makedirs(f"{project_name}/data", exist_ok=True)
     namelist_path = f"{project_name}/namelists"
-    makedirs(namelist_path)
+    makedirs(namelist_path, exist_ok=True)
 
-    copyfile(wrfrun_config.parse_resource_uri(CONFIG_MAIN_TOML_TEMPLATE), f"{project_name}/config.toml")
-    copyfile(wrfrun_config.parse_resource_uri(GITIGNORE_RULES), f"{project_name}/.gitignore")
+    wrfrun_config = _get_wrfrun_config()
+    copyfile(_get_template_path(wrfrun_config, "CONFIG_MAIN_TOML_TEMPLATE"), f"{project_name}/config.toml")
+    copyfile(_get_template_path(wrfrun_config, "GITIGNORE_RULES"), f"{project_name}/.gitignore")
 
     model_list = []
     if models is not None:
         for _model in models:
             if _model in MODEL_MAP:
-                src_path = wrfrun_config.parse_resource_uri(MODEL_MAP[_model])
+                src_path = _get_template_path(wrfrun_config, MODEL_MAP[_model])
                 copyfile(src_path, f"{project_name}/configs/{_model}.toml")
-                makedirs(f"{namelist_path}/{_model}")
+                makedirs(f"{namelist_path}/{_model}", exist_ok=True)
                 model_list.append(_model)
 
             else:
@@ -113,14 +167,18 @@ def _entry_init(args: argparse.Namespace):
     logger.info("Use command `[magenta]wrfrun add MODEL_NAME[/]` to add a new model to project.")
 
 
-def _entry_model(args: argparse.Namespace):
+def _entry_model(configs: dict):
     """
     Manage models used by wrfrun project.
 
-    :param args: Arguments namespace.
-    :type args: argparse.Namespace
+    :param configs: Parsed arguments.
+    :type configs: dict
     """
-    configs = vars(args)
+    import tomli
+    import tomli_w
+
+    from .log import logger
+
     new_models = configs["add"]
     config_path = configs["config"]
 
@@ -135,8 +193,7 @@ def _entry_model(args: argparse.Namespace):
 
     config_dir_path = f"{abspath(dirname(config_path))}/configs"
 
-    if not exists(config_dir_path):
-        makedirs(config_dir_path)
+    makedirs(config_dir_path, exist_ok=True)
 
     with open(config_path, "rb") as f:
         main_config = tomli.load(f)
@@ -163,8 +220,9 @@ def _entry_model(args: argparse.Namespace):
                     "include": f"./configs/{_new_model}.toml",
                 }
 
+    wrfrun_config = _get_wrfrun_config()
     for _new_model in new_models:
-        copyfile(wrfrun_config.parse_resource_uri(MODEL_MAP[_new_model]), f"{config_dir_path}/{_new_model}.toml")
+        copyfile(_get_template_path(wrfrun_config, MODEL_MAP[_new_model]), f"{config_dir_path}/{_new_model}.toml")
 
     with open(config_path, "wb") as f:
         tomli_w.dump(main_config, f)
@@ -172,27 +230,127 @@ def _entry_model(args: argparse.Namespace):
     logger.info(f"Added models: {new_models}")
 
 
-def main_entry():
+def _cli_error(usage: str, message: str):
     """
-    CLI entry point.
+    Print the usage and the error message, then exit with code 2.
+
+    :param usage: Usage string of the command.
+    :type usage: str
+    :param message: Error message.
+    :type message: str
+    """
+    sys.stderr.write(f"{usage.splitlines()[0]}\n{message}\n")
+    exit(2)
+
+
+def _parse_args(argv: list[str], options: dict[str, tuple[str, str]], usage: str) -> dict:
+    """
+    Parse the arguments of a subcommand.
+
+    ``options`` maps every accepted flag to ``(dest, nargs)``,
+    in which ``nargs`` is ``"1"`` for a single value, ``"*"`` for zero or more values and ``"+"`` for one or more values.
+
+    :param argv: Arguments after the subcommand.
+    :type argv: list[str]
+    :param options: Accepted flags.
+    :type options: dict
+    :param usage: Help message of the subcommand.
+    :type usage: str
+    :return: A dict maps ``dest`` to parsed values. Values of missing flags are ``None``.
+    :rtype: dict
     """
-    args_parser = argparse.ArgumentParser()
-    subparsers = args_parser.add_subparsers(title="Subcommands", description="Valid Subcommands", help="Subcommands")
+    configs: dict = {dest: None for dest, _ in options.values()}
+
+    index = 0
+    while index < len(argv):
+        flag = argv[index]
+        index += 1
+
+        if flag in ("-h", "--help"):
+            sys.stdout.write(usage)
+            exit(0)
+
+        value = None
+        if flag.startswith("--") and "=" in flag:
+            flag, value = flag.split("=", 1)
+
+        if flag not in options:
+            _cli_error(usage, f"unrecognized arguments: {flag}")
+
+        dest, nargs = options[flag]
+
+        if value is not None:
+            configs[dest] = value if nargs == "1" else [value]
+            continue
 
-    init_parser = subparsers.add_parser("init", help="Initialize a wrfrun project.", add_help=True)
-    init_parser.add_argument("-n", "--name", type=str, help="Name of the wrfrun project.")
-    init_parser.add_argument("--models", nargs="*", type=str, help="List of models to use.", choices=["wrf", "palm"])
-    init_parser.set_defaults(func=_entry_init)
+        values = []
+        while index < len(argv) and not argv[index].startswith("-"):
+            values.append(argv[index])
+            index += 1
+            if nargs == "1":
+                break
 
-    model_parser = subparsers.add_parser("model", help="Manage models used by wrfrun project.", add_help=True)
-    model_parser.add_argument("-c", "--config", type=str, default="config.toml", help="Path of the main config file.")
-    model_parser.add_argument(
-        "-a", "--add", nargs="+", required=True, type=str, help="Add models to the project.", choices=["wrf", "palm", "roms"]
-    )
-    model_parser.set_defaults(func=_entry_model)
+        if nargs != "*" and len(values) == 0:
+            _cli_error(usage, f"argument {flag}: expected {'one' if nargs == '1' else 'at least one'} argument")
 
-    args = args_parser.parse_args(args=None if sys.argv[1:] else ["--help"])
-    args.func(args)
+        configs[dest] = values[0] if nargs == "1" else values
+
+    return configs
+
+
+def _check_choices(usage: str, flag: str, values: list[str] | None, choices: tuple[str, ...]):
+    """
+    Check if all values are valid choices.
+
+    :param usage: Help message of the subcommand.
+    :type usage: str
+    :param flag: Name of the flag.
+    :type flag: str
+    :param values: Parsed values.
+    :type values: list[str] | None
+    :param choices: Valid choices.
+    :type choices: tuple[str, ...]
+    """
+    if values is None:
+        return
+
+    for _value in values:
+        if _value not in choices:
+            _cli_error(usage, f"argument {flag}: invalid choice: '{_value}' (choose from {', '.join(choices)})")
+
+
+def main_entry():
+    """
+    CLI entry point.
+    """
+    argv = sys.argv[1:]
+
+    if len(argv) == 0 or argv[0] in ("-h", "--help"):
+        sys.stdout.write(MAIN_HELP)
+        exit(0)
+
+    subcommand, argv = argv[0], argv[1:]
+
+    match subcommand:
+        case "init":
+            configs = _parse_args(argv, {"-n": ("name", "1"), "--name": ("name", "1"), "--models": ("models", "*")}, INIT_HELP)
+            _check_choices(INIT_HELP, "--models", configs["models"], ("wrf", "palm"))
+            _entry_init(configs)
+
+        case "model":
+            configs = _parse_args(
+                argv, {"-c": ("config", "1"), "--config": ("config", "1"), "-a": ("add", "+"), "--add": ("add", "+")}, MODEL_HELP
+            )
+            if configs["config"] is None:
+                configs["config"] = "config.toml"
+
+            if configs["add"] is None:
+                _cli_error(MODEL_HELP, "the following arguments are required: -a/--add")
+            _check_choices(MODEL_HELP, "-a/--add", configs["add"], ("wrf", "palm", "roms"))
+            _entry_model(configs)
+
+        case _:
+            _cli_error(MAIN_HELP, f"argument subcommand: invalid choice: '{subcommand}' (choose from init, model)")
 
 
 __all__ = ["main_entry"]
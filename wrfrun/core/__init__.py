@@ -47,11 +47,65 @@ Submodules
     type <core.type>
 """
 
-from ._config import *
-from ._exec_db import *
-from .base import *
-from .core import *
-from .error import *
-from .replay import *
-from .server import *
-from .type import *
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._config import *
+    from ._exec_db import *
+    from .base import *
+    from .core import *
+    from .error import *
+    from .replay import *
+    from .server import *
+    from .type import *
+
+# submodules are imported on the first access of their attributes,
+# so that light users (like the CLI) don't need to load server and replay code.
+_LAZY_ATTRS = {
+    "WRFRunConfig": "_config",
+    "ExecutableDB": "_exec_db",
+    "ExecutableBase": "base",
+    "call_subprocess": "base",
+    "call_subprocess_async": "base",
+    "WRFRUN": "core",
+    "WRFRUNProxy": "core",
+    "WRFRunBasicError": "error",
+    "ConfigError": "error",
+    "WRFRunContextError": "error",
+    "CommandError": "error",
+    "OutputFileError": "error",
+    "ResourceURIError": "error",
+    "InputFileError": "error",
+    "NamelistError": "error",
+    "ExecRegisterError": "error",
+    "GetExecClassError": "error",
+    "ModelNameError": "error",
+    "NamelistIDError": "error",
+    "RecordError": "error",
+    "replay_config_generator": "replay",
+    "WRFRunServer": "server",
+    "WRFRunServerHandler": "server",
+    "stop_server": "server",
+    "set_log_parse_func": "server",
+    "InputFileType": "type",
+    "FileConfigDict": "type",
+    "ExecutableClassConfig": "type",
+    "ExecutableConfig": "type",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    value = getattr(import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
+
+
+__all__ = list(_LAZY_ATTRS)
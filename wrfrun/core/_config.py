@@ -18,22 +18,88 @@ and :class:`DebugMixIn <wrfrun.core._debug.DebugMixIn>`
 Besides the methods from its parents, :class:`WRFRunConfig` provides methods to read and access user config files.
 """
 
-from copy import deepcopy
+from dataclasses import dataclass, fields
 from os import makedirs
-from os.path import abspath, dirname, exists
+from os.path import abspath, dirname, exists, join
 from shutil import copyfile
-from typing import Callable, Tuple
-
-import tomli
-import tomli_w
+from types import MappingProxyType
+from typing import Any, Callable, Tuple
 
 from ..log import logger
+from ..utils import clone_plain_data
 from ._constant import ConstantMixIn
 from ._debug import DebugMixIn
 from ._namelist import NamelistMixIn
 from ._resource import ResourceMixIn
 from .error import ModelNameError
 
+# use the C++ backed ``pytomlpp`` to parse TOML if it is installed, which is much faster than ``tomli``.
+try:
+    import pytomlpp
+
+    def _toml_loads(content: str) -> dict:
+        return pytomlpp.loads(content)
+
+    def _toml_dumps(config: dict) -> str:
+        return pytomlpp.dumps(config)
+
+except ImportError:
+    import tomli
+
+    def _toml_loads(content: str) -> dict:
+        return tomli.loads(content)
+
+    def _toml_dumps(config: dict) -> str:
+        # saving config is rare, so ``tomli_w`` is only imported when it is needed.
+        import tomli_w
+
+        return tomli_w.dumps(config)
+
+
+# number of threads used to link and move files, if ``io_thread_num`` isn't set in the config file.
+_DEFAULT_IO_THREAD_NUM = 8
+
+
+def _read_toml_file(file_path: str) -> dict:
+    """
+    Read and parse a TOML file.
+
+    :param file_path: TOML file path.
+    :type file_path: str
+    :return: Parsed config.
+    :rtype: dict
+    """
+    with open(file_path, "rb") as f:
+        return _toml_loads(f.read().decode())
+
+
+@dataclass(frozen=True, slots=True)
+class _ConfigView:
+    """
+    Read-only view of the top-level values in wrfrun config, which are read frequently.
+    """
+
+    input_data_path: str
+    output_path: str
+    log_path: str
+    server_host: str
+    server_port: int
+    core_num: int
+    io_thread_num: int | None
+    job_scheduler: dict
+
+    @classmethod
+    def from_config(cls, config: dict) -> "_ConfigView":
+        """
+        Create the view from wrfrun config.
+
+        :param config: wrfrun config.
+        :type config: dict
+        :return: New view.
+        :rtype: _ConfigView
+        """
+        return cls(**{field.name: config.get(field.name) for field in fields(cls)})
+
 
 class WRFRunConfig(ConstantMixIn, NamelistMixIn, ResourceMixIn, DebugMixIn):
     """
@@ -46,9 +112,14 @@ class WRFRunConfig(ConstantMixIn, NamelistMixIn, ResourceMixIn, DebugMixIn):
         :param work_dir: ``wrfrun`` work directory path.
         :type work_dir: str
         """
-        super().__init__(work_dir=work_dir)
+        # initialize parents explicitly rather than chaining ``super().__init__`` through every mixin.
+        ConstantMixIn.__init__(self, work_dir)
+        NamelistMixIn.__init__(self)
+        ResourceMixIn.__init__(self)
+        DebugMixIn.__init__(self)
 
         self._config = {}
+        self._config_view: _ConfigView | None = None
 
         self._config_template_file_path = None
 
@@ -61,10 +132,12 @@ class WRFRunConfig(ConstantMixIn, NamelistMixIn, ResourceMixIn, DebugMixIn):
         :param func_list: A list contains register functions.
         :type func_list: list[Callable[["WRFRunConfig"], None]]
         """
-        while len(func_list) != 0:
-            _func = func_list.pop(0)
+        # list iterator also picks up functions appended during iteration
+        for _func in func_list:
             _func(self)
 
+        func_list.clear()
+
     @classmethod
     def from_config_file(cls, config_file: str, register_funcs: list[Callable[["WRFRunConfig"], None]]) -> "WRFRunConfig":
         """
@@ -77,8 +150,7 @@ class WRFRunConfig(ConstantMixIn, NamelistMixIn, ResourceMixIn, DebugMixIn):
         :return: New instance
         :rtype: WRFRunConfig
         """
-        with open(config_file, "rb") as f:
-            config = tomli.load(f)
+        config = _read_toml_file(config_file)
 
         instance = cls(work_dir=config["work_dir"])
         instance.apply_register_func(register_funcs)
@@ -101,6 +173,44 @@ class WRFRunConfig(ConstantMixIn, NamelistMixIn, ResourceMixIn, DebugMixIn):
         """
         self._config_template_file_path = file_path
 
+    def _read_config_file(self, config_path: str) -> dict:
+        """
+        Read the config file and merge included model config files into it.
+
+        :param config_path: Absolute path of the TOML config file.
+        :type config_path: str
+        :return: Config dict.
+        :rtype: dict
+        """
+        config = _read_toml_file(config_path)
+
+        config_dir_path = dirname(config_path)
+
+        # merge model config.
+        keys_list = list(config["model"].keys())
+        for model_key in keys_list:
+            # skip the key that isn't model.
+            if model_key == "debug_level":
+                continue
+
+            if "include" not in config["model"][model_key]:
+                continue
+
+            # use = True, and have "include" key
+            if config["model"][model_key]["use"]:
+                # relative path is resolved based on the main config file.
+                include_file = abspath(join(config_dir_path, config["model"][model_key]["include"]))
+
+                # keep "use" key, as other components may use this key
+                _mode_config = _read_toml_file(include_file)
+                _mode_config.update({"use": True})
+                config["model"][model_key] = _mode_config
+
+            else:
+                config["model"].pop(model_key)
+
+        return config
+
     def load_wrfrun_config(self, config_path: str):
         """
         Load configs from a config file.
@@ -111,47 +221,20 @@ class WRFRunConfig(ConstantMixIn, NamelistMixIn, ResourceMixIn, DebugMixIn):
         :param config_path: TOML config file.
         :type config_path: str
         """
-        config_template_path = self.parse_resource_uri(self._config_template_file_path)
+        # resolve the path once, all the helpers below work with the absolute path.
+        config_path = abspath(config_path)
 
         if not exists(config_path):
             logger.error(f"Config file doesn't exist, copy template config to {config_path}")
             logger.error("Please modify it.")
 
-            if not exists(dirname(config_path)):
-                makedirs(dirname(config_path))
+            config_template_path = self.parse_resource_uri(self._config_template_file_path)
+            makedirs(dirname(config_path), exist_ok=True)
 
             copyfile(config_template_path, config_path)
             raise FileNotFoundError(config_path)
 
-        with open(config_path, "rb") as f:
-            self._config = tomli.load(f)
-
-        config_dir_path = abspath(dirname(config_path))
-
-        # merge model config.
-        keys_list = list(self._config["model"].keys())
-        for model_key in keys_list:
-            # skip the key that isn't model.
-            if model_key == "debug_level":
-                continue
-
-            if "include" not in self._config["model"][model_key]:
-                continue
-
-            # use = True, and have "include" key
-            if self._config["model"][model_key]["use"]:
-                include_file = self._config["model"][model_key]["include"]
-                if include_file[0] != "/":
-                    include_file = f"{config_dir_path}/{include_file}"
-
-                with open(include_file, "rb") as f:
-                    # keep "use" key, as other components may use this key
-                    _mode_config = tomli.load(f)
-                    _mode_config.update({"use": True})
-                    self._config["model"][model_key] = _mode_config
-
-            else:
-                self._config["model"].pop(model_key)
+        self._config = self._read_config_file(config_path)
 
         # register URI for output directory.
         output_path = abspath(self["output_path"])
@@ -163,6 +246,8 @@ class WRFRunConfig(ConstantMixIn, NamelistMixIn, ResourceMixIn, DebugMixIn):
             logger.warning("It seems you forget to set 'input_data_path', set it to 'data'.")
             self._config["input_data_path"] = "data"
 
+        self._config_view = _ConfigView.from_config(self._config)
+
     def save_wrfrun_config(self, save_path: str):
         """
         Save wrfrun config to a file.
@@ -172,12 +257,10 @@ class WRFRunConfig(ConstantMixIn, NamelistMixIn, ResourceMixIn, DebugMixIn):
         """
         save_path = self.parse_resource_uri(save_path)
 
-        path_dir = dirname(save_path)
-        if not exists(path_dir):
-            makedirs(path_dir)
+        makedirs(abspath(dirname(save_path)), exist_ok=True)
 
         with open(save_path, "wb") as f:
-            tomli_w.dump(self._config, f)
+            f.write(_toml_dumps(self._config).encode())
 
     def __getitem__(self, item: str):
         """
@@ -188,6 +271,9 @@ class WRFRunConfig(ConstantMixIn, NamelistMixIn, ResourceMixIn, DebugMixIn):
         >>> from wrfrun.core import WRFRUN
         >>> model_config = WRFRUN.config["model"]    # get all model configs.
 
+        The value is returned without copy, **DO NOT CHANGE IT**.
+        Use :meth:`WRFRunConfig.get_copy` if you need a value you can modify.
+
         :param item: Keys.
         :type item: str
         """
@@ -195,19 +281,55 @@ class WRFRunConfig(ConstantMixIn, NamelistMixIn, ResourceMixIn, DebugMixIn):
             logger.error("Attempt to read value before load config")
             raise RuntimeError("Attempt to read value before load config")
 
-        return deepcopy(self._config[item])
+        return self._config[item]
+
+    def get_copy(self, item: str) -> Any:
+        """
+        Get a deep copy of the config value, which can be changed safely.
+
+        :param item: Keys.
+        :type item: str
+        :return: Copy of the value.
+        :rtype: Any
+        """
+        return clone_plain_data(self[item])
+
+    @property
+    def view(self) -> MappingProxyType:
+        """
+        Read-only view of the whole wrfrun config.
+
+        :return: Read-only mapping.
+        :rtype: MappingProxyType
+        """
+        return MappingProxyType(self._config)
 
     def __setitem__(self, key: str, value):
         if key == "model":
             logger.error("Use `update_model_config` to change model configurations.")
             raise KeyError("Use `update_model_config` to change model configurations.")
 
-        if key in self._config:
-            self._config[key] = value
+        # the only lookup on the success path is the membership test, the error message is formatted once.
+        if key not in self._config:
+            message = f"Can't find key '{key}' in your config."
+            logger.error(message)
+            raise KeyError(message)
+
+        self._config[key] = value
+        self._config_view = _ConfigView.from_config(self._config)
+
+    def _get_config_view(self) -> _ConfigView:
+        """
+        Get the read-only view of frequently used config values.
+
+        :return: Config view.
+        :rtype: _ConfigView
+        """
+        if self._config_view is None:
+            logger.error("Attempt to read value before load config")
+            raise RuntimeError("Attempt to read value before load config")
 
-        else:
-            logger.error(f"Can't find key '{key}' in your config.")
-            raise KeyError(f"Can't find key '{key}' in your config.")
+        return self._config_view
 
     def get_input_data_path(self) -> str:
         """
@@ -216,12 +338,15 @@ class WRFRunConfig(ConstantMixIn, NamelistMixIn, ResourceMixIn, DebugMixIn):
         :return: Directory path.
         :rtype: str
         """
-        return deepcopy(self["input_data_path"])
+        return self._get_config_view().input_data_path
 
     def get_model_config(self, model_name: str) -> dict:
         """
         Get the config of a NWP model.
 
+        The dict is returned without copy, **DO NOT CHANGE IT**.
+        Use :meth:`WRFRunConfig.update_model_config` to change values.
+
         An exception :class:`ModelNameError <wrfrun.core.error.ModelNameError>` will be raised
         if the config can't be found.
 
@@ -230,11 +355,14 @@ class WRFRunConfig(ConstantMixIn, NamelistMixIn, ResourceMixIn, DebugMixIn):
         :return: A dictionary.
         :rtype: dict
         """
-        if model_name not in self["model"]:
-            logger.error(f"Config of model '{model_name}' isn't found in your config file.")
-            raise ModelNameError(f"Config of model '{model_name}' isn't found in your config file.")
+        model_configs = self["model"]
+
+        if model_name not in model_configs:
+            message = f"Config of model '{model_name}' isn't found in your config file."
+            logger.error(message)
+            raise ModelNameError(message)
 
-        return self["model"][model_name]
+        return model_configs[model_name]
 
     def update_model_config(self, model_name: str, value: dict):
         """
@@ -249,8 +377,9 @@ class WRFRunConfig(ConstantMixIn, NamelistMixIn, ResourceMixIn, DebugMixIn):
         :type value: dict
         """
         if model_name not in self["model"]:
-            logger.error(f"Config of model '{model_name}' isn't found in your config file.")
-            raise ModelNameError(f"Config of model '{model_name}' isn't found in your config file.")
+            message = f"Config of model '{model_name}' isn't found in your config file."
+            logger.error(message)
+            raise ModelNameError(message)
 
         self._config["model"][model_name].update(value)
 
@@ -261,7 +390,7 @@ class WRFRunConfig(ConstantMixIn, NamelistMixIn, ResourceMixIn, DebugMixIn):
         :return: A directory path.
         :rtype: str
         """
-        return self["log_path"]
+        return self._get_config_view().log_path
 
     def get_socket_server_config(self) -> Tuple[str, int]:
         """
@@ -270,16 +399,19 @@ class WRFRunConfig(ConstantMixIn, NamelistMixIn, ResourceMixIn, DebugMixIn):
         :return: ("host", port)
         :rtype: tuple
         """
-        return self["server_host"], self["server_port"]
+        config_view = self._get_config_view()
+        return config_view.server_host, config_view.server_port
 
     def get_job_scheduler_config(self) -> dict:
         """
         Get configs of job scheduler.
 
+        The dict is returned without copy, **DO NOT CHANGE IT**.
+
         :return: A dict object.
         :rtype: dict
         """
-        return deepcopy(self["job_scheduler"])
+        return self._get_config_view().job_scheduler
 
     def get_core_num(self) -> int:
         """
@@ -287,7 +419,17 @@ class WRFRunConfig(ConstantMixIn, NamelistMixIn, ResourceMixIn, DebugMixIn):
         :return: Core numbers
         :rtype: int
         """
-        return self["core_num"]
+        return self._get_config_view().core_num
+
+    def get_io_thread_num(self) -> int:
+        """
+        Get the number of threads used to link and move files.
+
+        :return: Thread numbers
+        :rtype: int
+        """
+        io_thread_num = self._get_config_view().io_thread_num
+        return _DEFAULT_IO_THREAD_NUM if io_thread_num is None else io_thread_num
 
     def write_namelist(self, save_path: str, namelist_id: str, overwrite=True):
         """
@@ -15,7 +15,7 @@ This class provides methods to manage runtime constants of ``wrfrun``.
 
 from os import environ
 from os.path import abspath
-from sys import platform
+from sys import intern, platform
 
 from ..log import logger
 from .error import WRFRunContextError
@@ -26,7 +26,28 @@ class ConstantMixIn:
     Define all variables that will be used by other components.
     """
 
-    def __init__(self, work_dir: str, *args, **kwargs):
+    WRFRUN_WORKSPACE_REPLAY = intern(":WRFRUN_WORKSPACE_REPLAY:")
+    """Path (URI) to store related files of ``wrfrun`` replay functionality."""
+
+    WRFRUN_TEMP_PATH = intern(":WRFRUN_TEMP_PATH:")
+    """Path (URI) to store ``wrfrun`` temporary files."""
+
+    WRFRUN_HOME_PATH = intern(":WRFRUN_HOME_PATH:")
+    """Root path (URI) of all others directories."""
+
+    WRFRUN_WORKSPACE_ROOT = intern(":WRFRUN_WORKSPACE_ROOT:")
+    """Path (URI) of the root workspace."""
+
+    WRFRUN_WORKSPACE_MODEL = intern(":WRFRUN_WORKSPACE_MODEL:")
+    """Path (URI) of the model workspace, in which ``wrfrun`` runs numerical models."""
+
+    WRFRUN_OUTPUT_PATH = intern(":WRFRUN_OUTPUT_PATH:")
+    """The root path (URI) to store all outputs of the ``wrfrun`` and NWP model."""
+
+    WRFRUN_RESOURCE_PATH = intern(":WRFRUN_RESOURCE_PATH:")
+    """The root path (URI) of all ``wrfrun`` resource files."""
+
+    def __init__(self, work_dir: str):
         """
         Define all variables that will be used by other components.
 
@@ -75,9 +96,6 @@ class ConstantMixIn:
         # record context status
         self._WRFRUN_CONTEXT_STATUS = False
 
-        self._WRFRUN_OUTPUT_PATH = ":WRFRUN_OUTPUT_PATH:"
-        self._WRFRUN_RESOURCE_PATH = ":WRFRUN_RESOURCE_PATH:"
-
         self.IS_IN_REPLAY: bool = False
 
         self.IS_RECORDING: bool = False
@@ -86,8 +104,6 @@ class ConstantMixIn:
         # all output rules will also not be executed.
         self.FAKE_SIMULATION_MODE = False
 
-        super().__init__(*args, **kwargs)
-
     def _get_uri_map(self) -> dict[str, str]:
         """
         Return URIs and their values.
@@ -104,56 +120,6 @@ class ConstantMixIn:
             self.WRFRUN_WORKSPACE_REPLAY: self._WRFRUN_WORKSPACE_REPLAY,
         }
 
-    @property
-    def WRFRUN_WORKSPACE_REPLAY(self) -> str:
-        """
-        Path (URI) to store related files of ``wrfrun`` replay functionality.
-
-        :return: URI.
-        :rtype: str
-        """
-        return ":WRFRUN_WORKSPACE_REPLAY:"
-
-    @property
-    def WRFRUN_TEMP_PATH(self) -> str:
-        """
-        Path to store ``wrfrun`` temporary files.
-
-        :return: URI
-        :rtype: str
-        """
-        return ":WRFRUN_TEMP_PATH:"
-
-    @property
-    def WRFRUN_HOME_PATH(self) -> str:
-        """
-        Root path of all others directories. .
-
-        :return: URI
-        :rtype: str
-        """
-        return ":WRFRUN_HOME_PATH:"
-
-    @property
-    def WRFRUN_WORKSPACE_ROOT(self) -> str:
-        """
-        Path of the root workspace.
-
-        :return: URI
-        :rtype: str
-        """
-        return ":WRFRUN_WORKSPACE_ROOT:"
-
-    @property
-    def WRFRUN_WORKSPACE_MODEL(self) -> str:
-        """
-        Path of the model workspace, in which ``wrfrun`` runs numerical models.
-
-        :return: URI
-        :rtype: str
-        """
-        return ":WRFRUN_WORKSPACE_MODEL:"
-
     @property
     def WRFRUN_WORK_STATUS(self) -> str:
         """
@@ -181,26 +147,6 @@ class ConstantMixIn:
         """
         self._WRFRUN_WORK_STATUS = value
 
-    @property
-    def WRFRUN_OUTPUT_PATH(self) -> str:
-        """
-        The root path to store all outputs of the ``wrfrun`` and NWP model.
-
-        :return: URI
-        :rtype: str
-        """
-        return self._WRFRUN_OUTPUT_PATH
-
-    @property
-    def WRFRUN_RESOURCE_PATH(self) -> str:
-        """
-        The root path of all ``wrfrun`` resource files.
-
-        :return: URI
-        :rtype: str
-        """
-        return self._WRFRUN_RESOURCE_PATH
-
     def check_wrfrun_context(self, error=False) -> bool:
         """
         Check if in WRFRun context or not.
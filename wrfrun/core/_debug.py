@@ -29,6 +29,8 @@ Environmental parameters
 * ``WRFRUN_DEBUG_MODE``: For ``DEBUG_MODE``, ``1`` or ``0``.
 * ``WRFRUN_DEBUG_MODE_LOGGER``: For ``DEBUG_MODE_LOGGER``, ``1`` or ``0``.
 * ``WRFRUN_DEBUG_MODE_EXECUTABLE``: For ``DEBUG_MODE_EXECUTABLE``, ``1`` or ``0``.
+
+``1``, ``true``, ``yes`` and ``on`` (case-insensitive) turn an option on, any other value turns it off.
 """
 
 import logging
@@ -37,16 +39,34 @@ from os import environ
 from wrfrun.log import logger
 
 
+def _as_bool(value: str | None, default: bool | None) -> bool | None:
+    """
+    Convert the value of an environmental variable to a switch.
+
+    :param value: Value of the environmental variable. ``None`` if it isn't set.
+    :type value: str | None
+    :param default: Value returned if the environmental variable isn't set.
+    :type default: bool | None
+    :return: ``True`` if ``value`` is one of ``1``, ``true``, ``yes`` and ``on`` (case-insensitive), else ``False``.
+    :rtype: bool | None
+    """
+    if value is None:
+        return default
+
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 class DebugMixIn:
     """
     Provide methods and attributes to debug ``wrfrun`` itself.
     """
 
-    _environ_params = [
-        "WRFRUN_DEBUG_MODE",
-        "WRFRUN_DEBUG_MODE_LOGGER",
-        "WRFRUN_DEBUG_MODE_EXECUTABLE",
-    ]
+    # (environmental variable, attribute name, default value)
+    _environ_params = (
+        ("WRFRUN_DEBUG_MODE", "_debug_mode", False),
+        ("WRFRUN_DEBUG_MODE_LOGGER", "_debug_mode_logger", None),
+        ("WRFRUN_DEBUG_MODE_EXECUTABLE", "_debug_mode_executable", None),
+    )
 
     def __init__(self):
         """
@@ -56,30 +76,14 @@ class DebugMixIn:
         self._debug_mode_logger: bool | None = None
         self._debug_mode_executable: bool | None = None
 
-        if "WRFRUN_DEBUG_MODE" in environ:
-            if environ["WRFRUN_DEBUG_MODE"]:
-                self._debug_mode = True
-
-            else:
-                self._debug_mode = False
-
-        if "WRFRUN_DEBUG_MODE_LOGGER" in environ:
-            if environ["WRFRUN_DEBUG_MODE_LOGGER"]:
-                self._debug_mode_logger = True
-
-            else:
-                self._debug_mode_logger = False
+        is_env_set = False
+        for env_name, attr_name, default_value in self._environ_params:
+            value = environ.get(env_name)
+            is_env_set = is_env_set or value is not None
+            setattr(self, attr_name, _as_bool(value, default_value))
 
-        if "WRFRUN_DEBUG_MODE_EXECUTABLE" in environ:
-            if environ["WRFRUN_DEBUG_MODE_EXECUTABLE"]:
-                self._debug_mode_executable = True
-
-            else:
-                self._debug_mode_executable = False
-
-        self._change_log_level()
-
-        super().__init__()
+        if is_env_set:
+            self._change_log_level()
 
     @property
     def DEBUG_MODE(self) -> bool:
@@ -133,6 +137,8 @@ class DebugMixIn:
     def _change_log_level(self):
         """
         Change logging level when ``DEBUG_MODE_LOGGER`` is changed.
+
+        Nothing will be done if the logger is already at the target level.
         """
         if self._debug_mode_logger is None and self._debug_mode:
             is_debug = True
@@ -143,12 +149,17 @@ class DebugMixIn:
         else:
             is_debug = False
 
+        target_level = logging.DEBUG if is_debug else logging.INFO
+
+        if logger.level == target_level:
+            return
+
+        logger.setLevel(target_level)
+
         if is_debug:
-            logger.setLevel(logging.DEBUG)
             logger.info("Logger debug mode is on.")
 
         else:
-            logger.setLevel(logging.INFO)
             logger.info("Logger debug mode is off.")
 
 
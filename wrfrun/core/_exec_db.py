@@ -38,10 +38,12 @@ class ExecutableDB:
         :param func_list: A list contains register functions.
         :type func_list: list[Callable[["WRFRunExecutableRegisterCenter"], None]]
         """
-        while len(func_list) != 0:
-            _func = func_list.pop(0)
+        # list iterator also picks up functions appended during iteration
+        for _func in func_list:
             _func(self)
 
+        func_list.clear()
+
     def register_exec(self, name: str, cls: type):
         """
         Register an ``Executable`` with a unique ``name``.
@@ -66,9 +68,8 @@ class ExecutableDB:
         :param name: Unique name.
         :type name: str
         """
-        if name in self._exec_db:
-            logger.debug(f"Unregister Executable: '{name}'.")
-            self._exec_db.pop(name)
+        if self._exec_db.pop(name, None) is not None:
+            logger.debug("Unregister Executable: '%s'.", name)
 
     def is_registered(self, name: str) -> bool:
         """
@@ -79,10 +80,7 @@ class ExecutableDB:
         :return: True or False.
         :rtype: bool
         """
-        if name in self._exec_db:
-            return True
-        else:
-            return False
+        return name in self._exec_db
 
     def get_cls(self, name: str) -> type:
         """
@@ -95,11 +93,13 @@ class ExecutableDB:
         :return: ``Executable`` class.
         :rtype: type
         """
-        if name not in self._exec_db:
+        cls = self._exec_db.get(name)
+
+        if cls is None:
             logger.error(f"Executable class '{name}' not found.")
             raise GetExecClassError(f"Executable class '{name}' not found.")
 
-        return self._exec_db[name]
+        return cls
 
 
 __all__ = ["ExecutableDB"]
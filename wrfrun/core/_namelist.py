@@ -68,26 +68,70 @@ which enables wrfrun to manage multiple namelist settings simultaneously.
     namelist.update_namelist(namelist_value, namelist_id)
 """
 
-from copy import deepcopy
-from os.path import exists
+from functools import lru_cache
+from os import stat
+from os.path import abspath, exists
+from time import time_ns
 from typing import Union
 
 import f90nml
 
 from ..log import logger
+from ..utils import clone_plain_data
 from .error import NamelistError, NamelistIDError
 
+# files modified within this time (in nanoseconds) are parsed without cache,
+# because a rewrite within one timestamp tick may not change the modification time.
+_NAMELIST_CACHE_MIN_AGE_NS = 2 * 10**9
+
+
+@lru_cache(maxsize=32)
+def _read_namelist_file_cached(file_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Read and parse a namelist file.
+
+    ``mtime_ns`` and ``size`` are only used as part of the cache key, so the file is parsed again once it is changed.
+
+    :param file_path: Absolute namelist file path.
+    :type file_path: str
+    :param mtime_ns: Modification time of the file in nanoseconds.
+    :type mtime_ns: int
+    :param size: Size of the file.
+    :type size: int
+    :return: Namelist values. Don't modify it because it is shared by all callers.
+    :rtype: dict
+    """
+    return f90nml.read(file_path).todict()
+
+
+def _read_namelist_file(file_path: str) -> dict:
+    """
+    Read namelist values from a file, the file is only parsed again if it has been changed since the last read.
+
+    Files modified recently are always parsed again, since their modification time may not change after being rewritten.
+
+    :param file_path: Namelist file path.
+    :type file_path: str
+    :return: A copy of namelist values.
+    :rtype: dict
+    """
+    file_path = abspath(file_path)
+    file_stat = stat(file_path)
+
+    if time_ns() - file_stat.st_mtime_ns < _NAMELIST_CACHE_MIN_AGE_NS:
+        return f90nml.read(file_path).todict()
+
+    return clone_plain_data(_read_namelist_file_cached(file_path, file_stat.st_mtime_ns, file_stat.st_size))
+
 
 class NamelistMixIn:
     """
     Manage namelist settings of NWP models.
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self):
         self._namelist_dict = {}
-        self._namelist_id_list: tuple[str, ...] = ("param", "geog_static_data", "wps", "wrf", "wrfda", "palm")
-
-        super().__init__(*args, **kwargs)
+        self._namelist_id_list: set[str] = {"param", "geog_static_data", "wps", "wrf", "wrfda", "palm"}
 
     def register_namelist_id(self, namelist_id: str) -> bool:
         """
@@ -102,7 +146,7 @@ class NamelistMixIn:
             return False
 
         else:
-            self._namelist_id_list += (namelist_id,)
+            self._namelist_id_list.add(namelist_id)
             return True
 
     def unregister_namelist_id(self, namelist_id: str):
@@ -117,12 +161,7 @@ class NamelistMixIn:
             return
 
         self.delete_namelist(namelist_id)
-        self._namelist_id_list = tuple(
-            set(self._namelist_id_list)
-            - {
-                namelist_id,
-            }
-        )
+        self._namelist_id_list.discard(namelist_id)
 
     def check_namelist_id(self, namelist_id: str) -> bool:
         """
@@ -133,10 +172,7 @@ class NamelistMixIn:
         :return: True if the ``namelist_id`` is registered, else False.
         :rtype: bool
         """
-        if namelist_id in self._namelist_id_list:
-            return True
-        else:
-            return False
+        return namelist_id in self._namelist_id_list
 
     def read_namelist(self, file_path: str, namelist_id: str):
         """
@@ -159,7 +195,7 @@ class NamelistMixIn:
             logger.error(f"Unknown namelist id: {namelist_id}, register it first.")
             raise NamelistIDError(f"Unknown namelist id: {namelist_id}, register it first.")
 
-        self._namelist_dict[namelist_id] = f90nml.read(file_path).todict()
+        self._namelist_dict[namelist_id] = _read_namelist_file(file_path)
 
     def write_namelist(self, save_path: str, namelist_id: str, overwrite=True):
         """
@@ -184,6 +220,7 @@ class NamelistMixIn:
             raise NamelistError(f"Can't found custom namelist '{namelist_id}', maybe you forget to read it first")
 
         f90nml.Namelist(self._namelist_dict[namelist_id]).write(save_path, force=overwrite)
+        _read_namelist_file_cached.cache_clear()
 
     def update_namelist(self, new_values: Union[str, dict], namelist_id: str):
         """
@@ -226,7 +263,7 @@ class NamelistMixIn:
             if not exists(new_values):
                 logger.error(f"File not found: {new_values}")
                 raise FileNotFoundError(f"File not found: {new_values}")
-            new_values = f90nml.read(new_values).todict()
+            new_values = _read_namelist_file(new_values)
 
         for key in new_values:
             if key in reference:
@@ -246,11 +283,14 @@ class NamelistMixIn:
         if namelist_id not in self._namelist_id_list:
             logger.error(f"Unknown namelist id: {namelist_id}, register it first.")
             raise NamelistIDError(f"Unknown namelist id: {namelist_id}, register it first.")
-        elif namelist_id not in self._namelist_dict:
+
+        namelist = self._namelist_dict.get(namelist_id)
+
+        if namelist is None:
             logger.error(f"Can't found custom namelist '{namelist_id}', maybe you forget to read it first")
             raise NamelistError(f"Can't found custom namelist '{namelist_id}', maybe you forget to read it first")
-        else:
-            return deepcopy(self._namelist_dict[namelist_id])
+
+        return clone_plain_data(namelist)
 
     def delete_namelist(self, namelist_id: str):
         """
@@ -263,10 +303,7 @@ class NamelistMixIn:
             logger.error(f"Unknown namelist id: {namelist_id}, register it first.")
             raise ValueError(f"Unknown namelist id: {namelist_id}, register it first.")
 
-        if namelist_id not in self._namelist_dict:
-            return
-
-        self._namelist_dict.pop(namelist_id)
+        self._namelist_dict.pop(namelist_id, None)
 
     def check_namelist(self, namelist_id: str) -> bool:
         """
@@ -277,11 +314,7 @@ class NamelistMixIn:
         :return: ``True`` if it is registered and loaded, else ``False``.
         :rtype: bool
         """
-        if namelist_id in self._namelist_id_list and namelist_id in self._namelist_dict:
-            return True
-
-        else:
-            return False
+        return namelist_id in self._namelist_id_list and namelist_id in self._namelist_dict
 
 
 __all__ = ["NamelistMixIn"]
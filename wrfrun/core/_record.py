@@ -16,21 +16,26 @@ A file ends with ``.replay`` will be generated after finishing recording,
 and users can reproduce the simulation with the ``.replay`` file.
 """
 
+from collections import defaultdict
 from json import dumps
-from os import makedirs, remove
-from os.path import basename, dirname, exists, isdir
-from shutil import copyfile, make_archive, move
+from os import makedirs, remove, replace, stat, stat_result, walk
+from os.path import basename, dirname, exists, join, relpath
+from shutil import copyfile
+from stat import S_ISDIR
+from typing import Any
+from zipfile import ZIP_STORED, ZipFile
 
 import numpy as np
 
-from ..log import check_path, logger
+from ..log import logger
+from ..utils import run_file_tasks
 from ._config import WRFRunConfig
 from .type import ExecutableConfig
 
 
 def _json_default(obj):
     """
-    Used for json.dumps.
+    Used for ``json.dumps`` and ``orjson.dumps``.
 
     :param obj:
     :type obj:
@@ -45,12 +50,79 @@ def _json_default(obj):
         raise TypeError(f"Object of type {type(obj)} is not JSON serializable.")
 
 
+# use the Rust backed ``orjson`` to export replay config if it is installed, which is much faster than ``json``.
+try:
+    import orjson
+
+    def _dumps_json(obj: Any, pretty: bool) -> bytes:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(obj, default=_json_default, option=option)
+
+except ImportError:
+
+    def _dumps_json(obj: Any, pretty: bool) -> bytes:
+        if pretty:
+            json_kwargs = {"indent": 4}
+        else:
+            json_kwargs = {"separators": (",", ":")}
+
+        return dumps(obj, default=_json_default, **json_kwargs).encode()
+
+
+# size of chunks read to compare file contents.
+_COMPARE_CHUNK_SIZE = 2**20
+
+
+def _stat_or_none(path: str) -> stat_result | None:
+    """
+    Get the status of a path.
+
+    :param path: Path.
+    :type path: str
+    :return: Status of the path, or ``None`` if it doesn't exist.
+    :rtype: os.stat_result | None
+    """
+    try:
+        return stat(path)
+
+    except OSError:
+        return None
+
+
+def _same_file_content(file_path_1: str, file_path_2: str) -> bool:
+    """
+    Check if two files have the same content by comparing their bytes.
+
+    :param file_path_1: Path of the first file.
+    :type file_path_1: str
+    :param file_path_2: Path of the second file.
+    :type file_path_2: str
+    :return: True if their contents are the same.
+    :rtype: bool
+    """
+    try:
+        with open(file_path_1, "rb") as f1, open(file_path_2, "rb") as f2:
+            while True:
+                chunk_1 = f1.read(_COMPARE_CHUNK_SIZE)
+                if chunk_1 != f2.read(_COMPARE_CHUNK_SIZE):
+                    return False
+
+                if not chunk_1:
+                    return True
+
+    except OSError:
+        return False
+
+
 class ExecutableRecorder:
     """
     This class provides methods to record simulations.
     """
 
-    def __init__(self, wrfrun_config: WRFRunConfig, save_path="./wrfrun.replay", include_data=False):
+    def __init__(self, wrfrun_config: WRFRunConfig, save_path="./wrfrun.replay", include_data=False, compression=ZIP_STORED):
         """
         :param wrfrun_config: `WRFRunConfig` instance.
         :type wrfrun_config: WRFRunConfig
@@ -58,17 +130,25 @@ class ExecutableRecorder:
         :type save_path: str, optional
         :param include_data: If includes data files, defaults to False
         :type include_data: bool, optional
+        :param compression: Compression method of the replay file, defaults to ``zipfile.ZIP_STORED``.
+                            Input data of models are usually compressed already, so files are stored without compression.
+        :type compression: int, optional
         """
         self._wrfrun_config = wrfrun_config
 
         self.save_path = save_path
         self.include_data = include_data
+        self.compression = compression
 
         self.work_path = self._wrfrun_config.parse_resource_uri(self._wrfrun_config.WRFRUN_WORKSPACE_REPLAY)
         self.content_path = f"{self.work_path}/config_and_data"
 
         self._recorded_config = []
-        self._name_count = {}
+        self._name_count: defaultdict[str, int] = defaultdict(int)
+        # URIs and paths of data files which have been saved, so the same file is only saved once.
+        # the key is ``(st_dev, st_ino, st_size, st_mtime_ns)`` of the file.
+        # the modification time may not change if the file is rewritten quickly, so contents are also compared.
+        self._saved_data: dict[tuple[int, int, int, int], tuple[str, str]] = {}
 
     def record(self, exported_config: ExecutableConfig):
         """
@@ -81,40 +161,53 @@ class ExecutableRecorder:
             self._recorded_config.append(exported_config)
             return
 
-        check_path(self.content_path)
-
         # process exported config so we can also include data.
-        # create directory to place data
+        # create directory to place data, makedirs also creates the content path.
         name = exported_config["name"]
-        if name in self._name_count:
-            self._name_count[name] += 1
-            index = self._name_count[name]
-        else:
-            self._name_count[name] = 1
-            index = 1
+        self._name_count[name] += 1
+        index = self._name_count[name]
 
         data_save_uri = f"{self._wrfrun_config.WRFRUN_WORKSPACE_REPLAY}/{name}/{index}"
         data_save_path = f"{self.content_path}/{name}/{index}"
-        makedirs(data_save_path)
+        makedirs(data_save_path, exist_ok=True)
 
-        input_file_config = exported_config["input_file_config"]
+        parse_resource_uri = self._wrfrun_config.parse_resource_uri
 
-        for _config_index, _config in enumerate(input_file_config):
+        # configs are modified in place, files are collected and saved together.
+        # files with the same name are saved to the same path, so only the last one is kept like saving them in order.
+        # static files like tables are used by many steps, they are saved once and shared by all configs.
+        file_copies: dict[str, tuple[str, tuple[int, int, int, int]]] = {}
+        for _config in exported_config["input_file_config"]:
             if not _config["is_data"]:
                 continue
 
             if _config["is_output"]:
                 continue
 
-            file_path = _config["file_path"]
-            file_path = self._wrfrun_config.parse_resource_uri(file_path)
+            file_path = parse_resource_uri(_config["file_path"])
+            file_stat = stat(file_path)
+            file_key = (file_stat.st_dev, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+
+            saved_data = self._saved_data.get(file_key)
+            if saved_data is not None and _same_file_content(file_path, saved_data[1]):
+                _config["file_path"] = saved_data[0]
+                continue
+
             filename = basename(file_path)
-            copyfile(file_path, f"{data_save_path}/{filename}")
+            file_copies[filename] = (file_path, file_key)
 
             _config["file_path"] = f"{data_save_uri}/{filename}"
-            input_file_config[_config_index] = _config
 
-        exported_config["input_file_config"] = input_file_config
+        # files are copied instead of linked, so the recorded data won't be changed if the input file is rewritten.
+        run_file_tasks(
+            copyfile,
+            [(file_path, f"{data_save_path}/{filename}") for filename, (file_path, _) in file_copies.items()],
+            self._wrfrun_config.get_io_thread_num(),
+        )
+
+        for filename, (_, file_key) in file_copies.items():
+            self._saved_data[file_key] = (f"{data_save_uri}/{filename}", f"{data_save_path}/{filename}")
+
         self._recorded_config.append(exported_config)
 
     def clear_records(self):
@@ -122,6 +215,7 @@ class ExecutableRecorder:
         Clean recorded configs.
         """
         self._recorded_config = []
+        self._saved_data.clear()
 
     def set_recorder(self, save_path: str | None, include_data: bool | None):
         """
@@ -133,7 +227,7 @@ class ExecutableRecorder:
         :type include_data: bool | None
         """
         if save_path is not None:
-            logger.debug(f"Change save path to: {save_path}")
+            logger.debug("Change save path to: %s", save_path)
             self.save_path = save_path
 
         if include_data is not None:
@@ -149,28 +243,44 @@ class ExecutableRecorder:
 
         logger.info("Exporting replay config... It may take a few minutes if you include data.")
 
-        check_path(self.content_path)
-
-        with open(f"{self.content_path}/config.json", "w") as f:
-            f.write(dumps(self._recorded_config, indent=4, default=_json_default))
+        save_path_stat = _stat_or_none(self.save_path)
 
-        if exists(self.save_path):
-            if isdir(self.save_path):
+        if save_path_stat is not None:
+            if S_ISDIR(save_path_stat.st_mode):
                 self.save_path = f"{self.save_path}/wrfrun.replay"
             else:
                 if not self.save_path.endswith(".replay"):
                     self.save_path = f"{self.save_path}.replay"
+                    save_path_stat = _stat_or_none(self.save_path)
 
-                if exists(self.save_path):
+                if save_path_stat is not None:
                     logger.warning(f"Found existed replay file with the same name '{basename(self.save_path)}', overwrite it")
-                    remove(self.save_path)
-
-        if not exists(dirname(self.save_path)):
-            makedirs(dirname(self.save_path))
 
-        temp_file = f"{self.work_path}/config_and_data"
-        make_archive(temp_file, "zip", self.content_path)
-        move(f"{temp_file}.zip", self.save_path)
+        save_dir = dirname(self.save_path)
+        if save_dir:
+            makedirs(save_dir, exist_ok=True)
+
+        # write the config and data into a temporary file in a single pass,
+        # the config is serialized in memory instead of being written to and read back from the disk.
+        # the temporary file is in the same directory, so an existing replay file is replaced atomically
+        # and won't be broken if the export fails.
+        temp_path = f"{self.save_path}.tmp"
+        try:
+            with ZipFile(temp_path, "w", compression=self.compression) as zip_file:
+                # only pretty-print the config in debug mode
+                zip_file.writestr("config.json", _dumps_json(self._recorded_config, self._wrfrun_config.DEBUG_MODE))
+
+                for root, _, filenames in walk(self.content_path):
+                    for filename in filenames:
+                        file_path = join(root, filename)
+                        zip_file.write(file_path, relpath(file_path, self.content_path))
+
+        except BaseException:
+            if exists(temp_path):
+                remove(temp_path)
+            raise
+
+        replace(temp_path, self.save_path)
 
         logger.info(f"Replay config exported to {self.save_path}")
 
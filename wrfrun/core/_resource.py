@@ -53,9 +53,21 @@ You can get the real file path using :meth:`parse_resource_uri <ResourceMixIn.pa
 it will parse all the URIs in the string.
 """
 
+import re
+
 from ..log import logger
 from .error import ResourceURIError
 
+# every URI starts with this prefix and ends with ":".
+_URI_PREFIX = ":WRFRUN_"
+_URI_PREFIX_LEN = len(_URI_PREFIX)
+
+# all URIs share the shape ":WRFRUN_...:", matching it at the start of a path gives the URI and where it ends.
+_URI_PATTERN = re.compile(r":WRFRUN_[^:]*:")
+
+# max number of parsed paths cached by each instance.
+_URI_CACHE_SIZE = 1024
+
 
 class ResourceMixIn:
     """
@@ -72,10 +84,10 @@ class ResourceMixIn:
     To convert any possible URIs in a string, user can use :meth:`ResourceMixIn.parse_resource_uri`.
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self):
         self._resource_namespace_db = {}
-
-        super().__init__(*args, **kwargs)
+        # parsed results of URI strings, it is cleared every time the URI table changes.
+        self._uri_cache: dict[str, str] = {}
 
     def check_resource_uri(self, unique_uri: str) -> bool:
         """
@@ -89,11 +101,7 @@ class ResourceMixIn:
         :return: True or False.
         :rtype: bool
         """
-        if unique_uri in self._resource_namespace_db:
-            return True
-
-        else:
-            return False
+        return unique_uri in self._resource_namespace_db
 
     def register_resource_uri(self, unique_uri: str, res_space_path: str):
         """
@@ -107,7 +115,7 @@ class ResourceMixIn:
         :param res_space_path: REAL absolute path of your resource path. For example, "$HOME/.config/wrfrun/res".
         :type res_space_path: str
         """
-        if not (unique_uri.startswith(":WRFRUN_") and unique_uri.endswith(":")):
+        if not (unique_uri[:_URI_PREFIX_LEN] == _URI_PREFIX and unique_uri[-1] == ":"):
             logger.error(f"Can't register resource URI: '{unique_uri}'. It should start with ':WRFRUN_' and end with ':'.")
             raise ResourceURIError(
                 f"Can't register resource URI: '{unique_uri}'. It should start with ':WRFRUN_' and end with ':'."
@@ -117,8 +125,9 @@ class ResourceMixIn:
             logger.error(f"Resource URI '{unique_uri}' exists.")
             raise ResourceURIError(f"Resource URI '{unique_uri}' exists.")
 
-        logger.debug(f"Register URI '{unique_uri}' to '{res_space_path}'")
+        logger.debug("Register URI '%s' to '%s'", unique_uri, res_space_path)
         self._resource_namespace_db[unique_uri] = res_space_path
+        self._uri_cache.clear()
 
     def unregister_resource_uri(self, unique_uri: str):
         """
@@ -127,8 +136,8 @@ class ResourceMixIn:
         :param unique_uri: Unique URI represents the resource.
         :type unique_uri: str
         """
-        if unique_uri in self._resource_namespace_db:
-            self._resource_namespace_db.pop(unique_uri)
+        if self._resource_namespace_db.pop(unique_uri, None) is not None:
+            self._uri_cache.clear()
 
     def parse_resource_uri(self, resource_path: str) -> str:
         """
@@ -149,24 +158,47 @@ class ResourceMixIn:
         :return: Real resource path.
         :rtype: str
         """
-        if not resource_path.startswith(":WRFRUN_"):
+        if resource_path[:_URI_PREFIX_LEN] != _URI_PREFIX:
             return resource_path
 
-        res_namespace_string = resource_path.split(":")[1]
-        res_namespace_string = f":{res_namespace_string}:"
+        real_path = self._uri_cache.get(resource_path)
+        if real_path is not None:
+            return real_path
+
+        real_path = self._convert_resource_uri(resource_path)
+
+        if len(self._uri_cache) >= _URI_CACHE_SIZE:
+            self._uri_cache.clear()
+        self._uri_cache[resource_path] = real_path
+
+        return real_path
+
+    def _convert_resource_uri(self, resource_path: str) -> str:
+        """
+        Convert URIs in the string without checking the cache.
+
+        :param resource_path: Resource path string which starts with a URI.
+        :type resource_path: str
+        :return: Real resource path.
+        :rtype: str
+        """
+        # URIs may be registered with values which start with other URIs, so convert them until no URI is left.
+        while resource_path[:_URI_PREFIX_LEN] == _URI_PREFIX:
+            match = _URI_PATTERN.match(resource_path)
+            if match is None:
+                logger.error(f"Unknown resource URI: '{resource_path}'")
+                raise ResourceURIError(f"Unknown resource URI: '{resource_path}'")
 
-        if res_namespace_string in self._resource_namespace_db:
-            resource_path = resource_path.replace(res_namespace_string, self._resource_namespace_db[res_namespace_string])
+            res_namespace_string = match.group()
+            res_space_path = self._resource_namespace_db.get(res_namespace_string)
 
-            if not resource_path.startswith(":WRFRUN_"):
-                return resource_path
+            if res_space_path is None:
+                logger.error(f"Unknown resource URI: '{res_namespace_string}'")
+                raise ResourceURIError(f"Unknown resource URI: '{res_namespace_string}'")
 
-            else:
-                return self.parse_resource_uri(resource_path)
+            resource_path = res_space_path + resource_path[match.end() :]
 
-        else:
-            logger.error(f"Unknown resource URI: '{res_namespace_string}'")
-            raise ResourceURIError(f"Unknown resource URI: '{res_namespace_string}'")
+        return resource_path
 
 
 __all__ = ["ResourceMixIn"]
@@ -7,6 +7,7 @@ wrfrun.core.base
 
     check_subprocess_status
     call_subprocess
+    call_subprocess_async
     ExecutableBase
 
 ExecutableBase
@@ -42,18 +43,54 @@ If you want to improve wrfrun's function to interact with external resources,
 I strongly recommend you to implement your code by inheriting :class:`ExecutableBase`.
 """
 
+import asyncio
+import fcntl
+import logging
+import shlex
 import subprocess
-from copy import deepcopy
-from os import chdir, getcwd, listdir, makedirs, remove, symlink
-from os.path import abspath, basename, dirname, exists
+from collections import deque
+from glob import glob
+from os import getpid, link, makedirs, remove, replace, scandir, symlink
+from os.path import abspath, basename, dirname, exists, isdir, lexists, samefile
 from shutil import move
-from typing import Optional, Union
+from threading import Thread, get_ident
+from typing import BinaryIO, Callable, Optional, Union
 
 from ..log import logger
+from ..utils import clone_plain_data, run_file_tasks
 from .core import WRFRUN
 from .error import CommandError, ConfigError, OutputFileError
 from .type import ExecutableClassConfig, ExecutableConfig, FileConfigDict
 
+# only the last lines of subprocess output are kept in memory, they are logged if the subprocess fails.
+_OUTPUT_BUFFER_LINES = 4096
+# ioctl request code to clone a file, ``fcntl.FICLONE`` is only available since Python 3.12.
+# its value differs between architectures, so reflink isn't tried if it is unavailable.
+_FICLONE = getattr(fcntl, "FICLONE", None)
+
+# seconds to wait for output readers after killing a subprocess,
+# its child processes may still hold the output pipes.
+_READER_KILL_TIMEOUT = 5
+
+# max length of a single line read from subprocess output, longer lines are read in chunks.
+_OUTPUT_LINE_LIMIT = 2**20
+
+
+class _LazyJoin:
+    """
+    Join a command list with shell quoting only when it is converted to a string, so it can be passed to the logger lazily.
+    """
+
+    def __init__(self, command: list[str]):
+        """
+        :param command: A list contains the command and parameters.
+        :type command: list
+        """
+        self.command = command
+
+    def __str__(self) -> str:
+        return shlex.join(self.command)
+
 
 def check_subprocess_status(status: subprocess.CompletedProcess):
     """
@@ -66,22 +103,253 @@ def check_subprocess_status(status: subprocess.CompletedProcess):
     :type status: CompletedProcess
     """
     if status.returncode != 0:
-        # print command
-        command = status.args
-        logger.error(f"Failed to exec command: {command}")
-
-        # print log
-        logger.error("====== stdout ======")
-        logger.error(status.stdout.decode())
-        logger.error("====== ====== ======")
-        logger.error("====== stderr ======")
-        logger.error(status.stderr.decode())
-        logger.error("====== ====== ======")
+        # output may be large, only decode it if the logger will print it.
+        if logger.isEnabledFor(logging.ERROR):
+            # print command
+            logger.error("Failed to exec command: %s", status.args)
+
+            # print log
+            logger.error("====== stdout ======")
+            logger.error(status.stdout.decode(errors="replace"))
+            logger.error("====== ====== ======")
+            logger.error("====== stderr ======")
+            logger.error(status.stderr.decode(errors="replace"))
+            logger.error("====== ====== ======")
 
         # raise error
         raise RuntimeError
 
 
+def _open_subprocess_log_files(log_save_prefix: str | None) -> tuple[BinaryIO | None, BinaryIO | None]:
+    """
+    Open files to save the standard output and error of a subprocess.
+
+    :param log_save_prefix: Prefix of log files. If None, no file will be opened.
+    :type log_save_prefix: str | None
+    :return: ``(stdout_file, stderr_file)``, or ``(None, None)`` if ``log_save_prefix`` is None.
+    :rtype: tuple
+    """
+    if not log_save_prefix:
+        return None, None
+
+    makedirs(dirname(log_save_prefix), exist_ok=True)
+
+    stdout_file = f"{log_save_prefix}.stdout"
+    stderr_file = f"{log_save_prefix}.stderr"
+
+    if exists(stdout_file):
+        old_stdout_file = f"{stdout_file}.bak"
+        logger.warning(f"stdout file exists. Backup it to '{old_stdout_file}'")
+
+    if exists(stderr_file):
+        old_stderr_file = f"{stderr_file}.bak"
+        logger.warning(f"stderr file exists. Backup it to '{old_stderr_file}'")
+
+    return open(stdout_file, "wb"), open(stderr_file, "wb")
+
+
+def _handle_output_line(line: bytes, buffer: deque, log_file: BinaryIO | None, log_func: Callable | None):
+    """
+    Store a line of subprocess output in the buffer, and save or print it.
+
+    :param line: Line of output.
+    :type line: bytes
+    :param buffer: Buffer which only keeps the last lines, they will be logged if the subprocess fails.
+    :type buffer: deque
+    :param log_file: File to save the output. If None, don't save.
+    :type log_file: BinaryIO | None
+    :param log_func: Logger method to print the output. If None, don't print.
+    :type log_func: Callable | None
+    """
+    buffer.append(line)
+
+    if log_file is not None:
+        log_file.write(line)
+
+    if log_func is not None:
+        log_func(line.decode(errors="replace").rstrip("\n"))
+
+
+def _get_output_log_funcs(print_output: bool) -> tuple[Callable | None, Callable | None]:
+    """
+    Get logger methods to print the standard output and error of a subprocess.
+
+    Lines are only decoded if they will be printed,
+    so ``None`` is returned if ``print_output`` is False or the logger ignores the level.
+
+    :param print_output: If print standard output and error in the logger.
+    :type print_output: bool
+    :return: ``(stdout_log_func, stderr_log_func)``.
+    :rtype: tuple
+    """
+    if not print_output:
+        return None, None
+
+    return (
+        logger.info if logger.isEnabledFor(logging.INFO) else None,
+        logger.warning if logger.isEnabledFor(logging.WARNING) else None,
+    )
+
+
+def _read_output_stream(
+    process: subprocess.Popen,
+    stream: BinaryIO,
+    buffer: deque,
+    log_file: BinaryIO | None,
+    log_func: Callable | None,
+    errors: list[BaseException],
+):
+    """
+    Read the output of a subprocess line by line until it exits.
+
+    This function runs in a thread, so the exception is stored in ``errors`` instead of being raised,
+    and the subprocess is killed because its output can't be processed anymore.
+
+    :param process: The subprocess.
+    :type process: subprocess.Popen
+    :param stream: Standard output or error of the subprocess.
+    :type stream: BinaryIO
+    :param buffer: Buffer which only keeps the last lines.
+    :type buffer: deque
+    :param log_file: File to save the output. If None, don't save.
+    :type log_file: BinaryIO | None
+    :param log_func: Logger method to print the output. If None, don't print.
+    :type log_func: Callable | None
+    :param errors: List to store the exception raised when reading the output.
+    :type errors: list
+    """
+    try:
+        for line in iter(lambda: stream.readline(_OUTPUT_LINE_LIMIT), b""):
+            _handle_output_line(line, buffer, log_file, log_func)
+
+    except BaseException as err:
+        errors.append(err)
+        process.kill()
+
+    finally:
+        stream.close()
+
+
+async def _read_output_stream_async(
+    stream: asyncio.StreamReader, buffer: deque, log_file: BinaryIO | None, log_func: Callable | None
+):
+    """
+    Asynchronous version of :func:`_read_output_stream`.
+
+    Exceptions are raised directly.
+
+    :param stream: Standard output or error of the subprocess.
+    :type stream: asyncio.StreamReader
+    :param buffer: Buffer which only keeps the last lines.
+    :type buffer: deque
+    :param log_file: File to save the output. If None, don't save.
+    :type log_file: BinaryIO | None
+    :param log_func: Logger method to print the output. If None, don't print.
+    :type log_func: Callable | None
+    """
+    while True:
+        try:
+            line = await stream.readuntil(b"\n")
+
+        except asyncio.IncompleteReadError as err:
+            # reach the end, the last line may not end with a newline.
+            if err.partial:
+                _handle_output_line(err.partial, buffer, log_file, log_func)
+            break
+
+        except asyncio.LimitOverrunError as err:
+            # the line is longer than the limit, process the part that has been read.
+            line = await stream.readexactly(err.consumed)
+
+        _handle_output_line(line, buffer, log_file, log_func)
+
+
+def _close_log_files(log_files: tuple[BinaryIO | None, BinaryIO | None]):
+    """
+    Close files used to save the standard output and error of a subprocess.
+
+    :param log_files: Files used to save the standard output and error.
+    :type log_files: tuple
+    """
+    for log_file in log_files:
+        if log_file is not None:
+            log_file.close()
+
+
+def _handle_spawn_error(error: OSError, stderr_buffer: deque, stderr_file: BinaryIO | None) -> int:
+    """
+    Store the error in the standard error if the subprocess can't be started, for example, the executable doesn't exist.
+
+    It's reported like a command which fails in the system shell.
+
+    :param error: Exception raised when starting the subprocess.
+    :type error: OSError
+    :param stderr_buffer: Buffer of the standard error.
+    :type stderr_buffer: deque
+    :param stderr_file: File to save the standard error. If None, don't save.
+    :type stderr_file: BinaryIO | None
+    :return: Return code of the command, which is ``127`` like the shell.
+    :rtype: int
+    """
+    _handle_output_line(f"{error}\n".encode(errors="replace"), stderr_buffer, stderr_file, None)
+    return 127
+
+
+def _finish_subprocess(
+    command: list[str],
+    return_code: int,
+    stdout_buffer: deque,
+    stderr_buffer: deque,
+    log_save_prefix: str | None,
+):
+    """
+    Check the status of a finished subprocess.
+
+    :param command: Executed command.
+    :type command: list
+    :param return_code: Return code of the subprocess.
+    :type return_code: int
+    :param stdout_buffer: Last lines of the standard output.
+    :type stdout_buffer: deque
+    :param stderr_buffer: Last lines of the standard error.
+    :type stderr_buffer: deque
+    :param log_save_prefix: Prefix of log files.
+    :type log_save_prefix: str | None
+    """
+    status = subprocess.CompletedProcess(command, return_code, b"".join(stdout_buffer), b"".join(stderr_buffer))
+    check_subprocess_status(status)
+
+    if log_save_prefix:
+        logger.info(f"Logs saved to '{dirname(log_save_prefix)}'")
+
+
+def _expand_command(command: list[str], work_path: Optional[str] = None) -> list[str]:
+    """
+    Expand wildcards in command arguments like the shell does, since commands aren't executed in the shell.
+
+    Only ``*`` and ``?`` are expanded, ``[`` is always matched literally.
+    Arguments which don't match any file are kept unchanged.
+
+    :param command: A list contains the command and parameters to be executed.
+    :type command: list
+    :param work_path: The work path of the command. Relative patterns are expanded in it.
+    :type work_path: str | None
+    :return: Command with wildcards expanded.
+    :rtype: list
+    """
+    expanded_command = []
+    for arg in command:
+        if "*" in arg or "?" in arg:
+            matched_files = sorted(glob(arg.replace("[", "[[]"), root_dir=work_path))
+            if matched_files:
+                expanded_command.extend(matched_files)
+                continue
+
+        expanded_command.append(arg)
+
+    return expanded_command
+
+
 def call_subprocess(
     command: list[str],
     work_path: Optional[str] = None,
@@ -89,7 +357,9 @@ def call_subprocess(
     log_save_prefix: str | None = None,
 ):
     """
-    Execute the given command in the system shell.
+    Execute the given command.
+
+    The command is executed directly instead of in the system shell, but wildcards in arguments are still expanded.
 
     :param command: A list contains the command and parameters to be executed.
     :type command: list
@@ -101,46 +371,253 @@ def call_subprocess(
     :param log_save_prefix: Save external command output and error to log files. If None, don't save.
                             Defaults to None.
     """
-    if work_path is not None:
-        origin_path = getcwd()
-        chdir(work_path)
-    else:
-        origin_path = None
+    command = _expand_command(command, work_path)
+    stdout_buffer, stderr_buffer = deque(maxlen=_OUTPUT_BUFFER_LINES), deque(maxlen=_OUTPUT_BUFFER_LINES)
+    stdout_file, stderr_file = _open_subprocess_log_files(log_save_prefix)
+    stdout_log_func, stderr_log_func = _get_output_log_funcs(print_output)
 
-    status = subprocess.run(" ".join(command), shell=True, capture_output=True)
+    try:
+        try:
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=work_path)
 
-    if origin_path is not None:
-        chdir(origin_path)
+        except OSError as err:
+            return_code = _handle_spawn_error(err, stderr_buffer, stderr_file)
 
-    check_subprocess_status(status)
+        else:
+            with process:
+                reader_errors: list[BaseException] = []
+                readers = [
+                    Thread(
+                        target=_read_output_stream,
+                        args=(process, process.stdout, stdout_buffer, stdout_file, stdout_log_func, reader_errors),
+                        daemon=True,
+                    ),
+                    Thread(
+                        target=_read_output_stream,
+                        args=(process, process.stderr, stderr_buffer, stderr_file, stderr_log_func, reader_errors),
+                        daemon=True,
+                    ),
+                ]
+                for reader in readers:
+                    reader.start()
 
-    if print_output:
-        logger.info(status.stdout.decode())
-        logger.warning(status.stderr.decode())
+                try:
+                    return_code = process.wait()
 
-    if log_save_prefix:
-        save_dir = dirname(log_save_prefix)
-        if not exists(save_dir):
-            makedirs(save_dir)
+                    # the subprocess is killed if readers fail, don't wait for the output of its child processes.
+                    if not reader_errors:
+                        for reader in readers:
+                            reader.join()
+
+                    if reader_errors:
+                        raise reader_errors[0]
+
+                except BaseException:
+                    # interrupted or failed to read the output, don't leave the subprocess running.
+                    process.kill()
+                    process.wait()
+
+                    for reader in readers:
+                        reader.join(_READER_KILL_TIMEOUT)
+
+                    raise
+
+    finally:
+        _close_log_files((stdout_file, stderr_file))
+
+    _finish_subprocess(command, return_code, stdout_buffer, stderr_buffer, log_save_prefix)
+
+
+async def call_subprocess_async(
+    command: list[str],
+    work_path: Optional[str] = None,
+    print_output=False,
+    log_save_prefix: str | None = None,
+):
+    """
+    Execute the given command without blocking the event loop.
+
+    It works the same as :func:`call_subprocess`,
+    but you can run several independent commands at the same time with :func:`asyncio.gather`.
+
+    :param command: A list contains the command and parameters to be executed.
+    :type command: list
+    :param work_path: The work path of the command.
+                      If None, works in current directory.
+    :type work_path: str | None
+    :param print_output: If print standard output and error in the logger.
+    :type print_output: bool
+    :param log_save_prefix: Save external command output and error to log files. If None, don't save.
+                            Defaults to None.
+    """
+    command = _expand_command(command, work_path)
+    stdout_buffer, stderr_buffer = deque(maxlen=_OUTPUT_BUFFER_LINES), deque(maxlen=_OUTPUT_BUFFER_LINES)
+    stdout_file, stderr_file = _open_subprocess_log_files(log_save_prefix)
+    stdout_log_func, stderr_log_func = _get_output_log_funcs(print_output)
+
+    try:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=work_path,
+                limit=_OUTPUT_LINE_LIMIT,
+            )
+
+        except OSError as err:
+            return_code = _handle_spawn_error(err, stderr_buffer, stderr_file)
+
+        else:
+            readers = [
+                asyncio.ensure_future(_read_output_stream_async(process.stdout, stdout_buffer, stdout_file, stdout_log_func)),
+                asyncio.ensure_future(_read_output_stream_async(process.stderr, stderr_buffer, stderr_file, stderr_log_func)),
+            ]
+
+            try:
+                await asyncio.gather(*readers)
+                return_code = await process.wait()
+
+            except BaseException:
+                # cancelled or failed to read the output, don't leave the subprocess running.
+                for reader in readers:
+                    reader.cancel()
+
+                if process.returncode is None:
+                    try:
+                        process.kill()
+
+                    except ProcessLookupError:
+                        pass
+
+                await asyncio.gather(*readers, return_exceptions=True)
+                await process.wait()
+
+                raise
+
+    finally:
+        _close_log_files((stdout_file, stderr_file))
+
+    _finish_subprocess(command, return_code, stdout_buffer, stderr_buffer, log_save_prefix)
+
+
+def _reflink_file(src: str, dst: str):
+    """
+    Create a copy-on-write clone of ``src``, which is supported by file systems like btrfs and XFS.
+
+    :param src: Source file path.
+    :type src: str
+    :param dst: Target file path, it must not exist.
+    :type dst: str
+    """
+    with open(src, "rb") as src_file, open(dst, "xb") as dst_file:
+        try:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+
+        except OSError:
+            remove(dst)
+            raise
+
+
+def _link_file(src: str, dst: str, link_mode="auto"):
+    """
+    Place ``src`` at ``dst`` without copying its content.
+
+    With ``link_mode="auto"``, a hard link is preferred because programs don't need to resolve it when opening the file.
+    If ``src`` is on another file system, a reflink copy is tried,
+    and a symbolic link is created if both of them aren't possible, or ``src`` is a directory.
+
+    :param src: Source file path.
+    :type src: str
+    :param dst: Target file path. :class:`FileExistsError` will be raised if it exists.
+    :type dst: str
+    :param link_mode: ``"auto"`` or ``"symlink"``. Defaults to ``"auto"``.
+    :type link_mode: str
+    """
+    if link_mode == "auto" and not isdir(src):
+        try:
+            link(src, dst)
+            return
+
+        except FileExistsError:
+            raise
+
+        except OSError:
+            pass
+
+        if _FICLONE is not None:
+            try:
+                _reflink_file(src, dst)
+                return
+
+            except FileExistsError:
+                raise
+
+            except OSError:
+                pass
+
+    symlink(src, dst)
+
+
+def _place_input_file(file_path: str, target_path: str, link_mode: str):
+    """
+    Link an input file to the target path, the existed target will be replaced.
+
+    :param file_path: Input file path.
+    :type file_path: str
+    :param target_path: Target file path.
+    :type target_path: str
+    :param link_mode: ``link_mode`` in :class:`FileConfigDict <wrfrun.core.type.FileConfigDict>`.
+    :type link_mode: str
+    """
+    try:
+        _link_file(file_path, target_path, link_mode)
+
+    except FileExistsError:
+        # skip the target if it's already a link to the file.
+        # rename() also does nothing if both paths are hard links of the same file.
+        try:
+            if samefile(file_path, target_path):
+                return
 
-        stdout_file = f"{log_save_prefix}.stdout"
-        stderr_file = f"{log_save_prefix}.stderr"
+        except OSError:
+            # the target is a dangling symbolic link.
+            pass
 
-        if exists(stdout_file):
-            old_stdout_file = f"{stdout_file}.bak"
-            logger.warning(f"stdout file exists. Backup it to '{old_stdout_file}'")
+        # link to a temporary path and replace the target atomically.
+        # the temporary path is unique to the thread, as files are placed in parallel.
+        logger.debug(f"Target file {basename(target_path)} exists, overwrite it.")
+        temp_path = f"{target_path}.tmp.{getpid()}.{get_ident()}"
+        _link_file(file_path, temp_path, link_mode)
+        replace(temp_path, target_path)
 
-        if exists(stderr_file):
-            old_stderr_file = f"{stderr_file}.bak"
-            logger.warning(f"stderr file exists. Backup it to '{old_stderr_file}'")
 
-        with open(stdout_file, "w") as f:
-            f.write(status.stdout.decode())
+def _save_output_file(file_path: str, save_path: str, target_path: str):
+    """
+    Move an output file to the target path.
+
+    :param file_path: Output file path.
+    :type file_path: str
+    :param save_path: Directory of the target path.
+    :type save_path: str
+    :param target_path: Target file path.
+    :type target_path: str
+    """
+    # lstat is enough, the target is replaced even if it's a dangling symbolic link.
+    if lexists(target_path):
+        logger.warning(
+            (
+                f"Found existed file, which means you already may have output files in '{save_path}'. "
+                "If you are saving logs, ignore this warning."
+            )
+        )
 
-        with open(stderr_file, "w") as f:
-            f.write(status.stderr.decode())
+    try:
+        replace(file_path, target_path)
 
-        logger.info(f"Logs saved to '{save_dir}'")
+    except OSError:
+        # across file systems, or the target is a directory.
+        move(file_path, target_path)
 
 
 class ExecutableBase:
@@ -173,7 +650,20 @@ class ExecutableBase:
 
     """
 
-    _instance = None
+    # one instance for each class, a subclass must not get the instance of its parent class.
+    _instances: dict[type, "ExecutableBase"] = {}
+
+    # if the class overwrites custom config hooks, the default ones do nothing and can be skipped.
+    _generate_custom_config_overridden = False
+    _load_custom_config_overridden = False
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Check which custom config hooks are overwritten by the subclass.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._generate_custom_config_overridden = cls.generate_custom_config is not ExecutableBase.generate_custom_config
+        cls._load_custom_config_overridden = cls.load_custom_config is not ExecutableBase.load_custom_config
 
     def __init__(
         self,
@@ -216,16 +706,41 @@ class ExecutableBase:
         self.custom_config: dict = {}
         self.input_file_config: list[FileConfigDict] = []
         self.output_file_config: list[FileConfigDict] = []
+        # output files found by ``add_output_files``, we don't need to check if they exist again.
+        self._found_output_files: set[str] = set()
+        # absolute paths of resolved URI strings.
+        self._resolved_path_cache: dict[str, str] = {}
+        # command built by ``_get_command`` and settings used to build it.
+        self._command_cache: list[str] = []
+        self._command_cache_key: tuple | None = None
 
         # directory to save outputs
         self._output_save_path = f"{WRFRUN.config.WRFRUN_OUTPUT_PATH}/{self.name}"
         self._log_save_path = f"{self._output_save_path}/logs"
 
     def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
+        instance = ExecutableBase._instances.get(cls)
+        if instance is None:
+            instance = super().__new__(cls)
+            ExecutableBase._instances[cls] = instance
+
+        return instance
+
+    def _resolve_path(self, path: str) -> str:
+        """
+        Convert URIs in the path and return its absolute path. Results are cached in the instance.
+
+        :param path: Path string which may contain URI string.
+        :type path: str
+        :return: Absolute path.
+        :rtype: str
+        """
+        real_path = self._resolved_path_cache.get(path)
+        if real_path is None:
+            real_path = abspath(WRFRUN.config.parse_resource_uri(path))
+            self._resolved_path_cache[path] = real_path
 
-        return cls._instance
+        return real_path
 
     def generate_custom_config(self):
         """
@@ -260,7 +775,8 @@ class ExecutableBase:
         :return: A dict contains configs.
         :rtype: ExecutableConfig
         """
-        self.generate_custom_config()
+        if self._generate_custom_config_overridden:
+            self.generate_custom_config()
 
         return {
             "name": self.name,
@@ -269,10 +785,10 @@ class ExecutableBase:
             "mpi_use": self.mpi_use,
             "mpi_cmd": self.mpi_cmd,
             "mpi_core_num": self.mpi_core_num,
-            "class_config": deepcopy(self.class_config),
-            "custom_config": deepcopy(self.custom_config),
-            "input_file_config": deepcopy(self.input_file_config),
-            "output_file_config": deepcopy(self.output_file_config),
+            "class_config": clone_plain_data(self.class_config),
+            "custom_config": clone_plain_data(self.custom_config),
+            "input_file_config": clone_plain_data(self.input_file_config),
+            "output_file_config": clone_plain_data(self.output_file_config),
         }
 
     def load_config(self, config: ExecutableConfig):
@@ -295,12 +811,15 @@ class ExecutableBase:
         self.mpi_use = config["mpi_use"]
         self.mpi_cmd = config["mpi_cmd"]
         self.mpi_core_num = config["mpi_core_num"]
-        self.class_config = deepcopy(config["class_config"])
-        self.custom_config = deepcopy(config["custom_config"])
-        self.input_file_config = deepcopy(config["input_file_config"])
-        self.output_file_config = deepcopy(config["output_file_config"])
+        self.class_config = clone_plain_data(config["class_config"])
+        self.custom_config = clone_plain_data(config["custom_config"])
+        self.input_file_config = clone_plain_data(config["input_file_config"])
+        self.output_file_config = clone_plain_data(config["output_file_config"])
+        self._found_output_files.clear()
+        self._resolved_path_cache.clear()
 
-        self.load_custom_config()
+        if self._load_custom_config_overridden:
+            self.load_custom_config()
 
     def replay(self):
         """
@@ -454,35 +973,26 @@ class ExecutableBase:
             output_dir = self.work_path
 
         if save_path is None:
-            save_path = f"{WRFRUN.config.WRFRUN_OUTPUT_PATH}/{self.name}"
-
-        file_list = listdir(WRFRUN.config.parse_resource_uri(output_dir))
-        save_file_list = []
-
-        if startswith is not None:
-            _list = []
-            for _file in file_list:
-                if _file.startswith(startswith):
-                    _list.append(_file)
-            save_file_list += _list
+            save_path = self._output_save_path
 
-            logger.debug(f"Collect files match `startswith`: {_list}")
-
-        if endswith is not None:
-            _list = []
-            for _file in file_list:
-                if _file.endswith(endswith):
-                    _list.append(_file)
-            save_file_list += _list
-
-            logger.debug(f"Collect files match `endswith`: {_list}")
+        if outputs is None:
+            output_set = set()
+        elif isinstance(outputs, str):
+            output_set = {outputs}
+        else:
+            output_set = set(outputs)
 
-        if outputs is not None:
-            if isinstance(outputs, str) and outputs in file_list:
-                save_file_list.append(outputs)
-            else:
-                outputs = [x for x in outputs if x in file_list]
-                save_file_list += outputs
+        # match all the rules in one pass.
+        save_file_list = []
+        with scandir(self._resolve_path(output_dir)) as entries:
+            for entry in entries:
+                _file = entry.name
+                if (
+                    _file in output_set
+                    or (startswith is not None and _file.startswith(startswith))
+                    or (endswith is not None and _file.endswith(endswith))
+                ):
+                    save_file_list.append(_file)
 
         if len(save_file_list) < 1:
             if no_file_error:
@@ -508,13 +1018,15 @@ class ExecutableBase:
                 )
                 return
 
-        save_file_list = list(set(save_file_list))
-        logger.debug(f"Files to be processed: {save_file_list}")
+        logger.debug("Files to be processed: %s", save_file_list)
 
+        output_prefix = f"{output_dir}/"
         for _file in save_file_list:
+            file_path = output_prefix + _file
+            self._found_output_files.add(file_path)
             self.output_file_config.append(
                 {
-                    "file_path": f"{output_dir}/{_file}",
+                    "file_path": file_path,
                     "save_path": save_path,
                     "save_name": _file,
                     "is_data": True,
@@ -530,30 +1042,29 @@ class ExecutableBase:
             logger.info(f"We are in fake simulation mode, skip preparing input files for '{self.name}'")
             return
 
+        # check all files first, and create each directory only once.
+        # files are placed in parallel, so only the last file of the same target is kept like placing them in order.
+        file_links: dict[str, tuple[str, str]] = {}
+        save_path_set = set()
         for input_file in self.input_file_config:
-            file_path = input_file["file_path"]
-            save_path = input_file["save_path"]
-            save_name = input_file["save_name"]
-
-            file_path = WRFRUN.config.parse_resource_uri(file_path)
-            save_path = WRFRUN.config.parse_resource_uri(save_path)
-
-            file_path = abspath(file_path)
-            save_path = abspath(save_path)
+            file_path = self._resolve_path(input_file["file_path"])
+            save_path = self._resolve_path(input_file["save_path"])
 
             if not exists(file_path):
                 logger.error(f"File not found: '{file_path}'")
                 raise FileNotFoundError(f"File not found: '{file_path}'")
 
-            if not exists(save_path):
-                makedirs(save_path)
+            save_path_set.add(save_path)
+            file_links[f"{save_path}/{input_file['save_name']}"] = (file_path, input_file.get("link_mode", "auto"))
 
-            target_path = f"{save_path}/{save_name}"
-            if exists(target_path):
-                logger.debug(f"Target file {save_name} exists, overwrite it.")
-                remove(target_path)
+        for save_path in save_path_set:
+            makedirs(save_path, exist_ok=True)
 
-            symlink(file_path, target_path)
+        run_file_tasks(
+            _place_input_file,
+            [(file_path, target_path, link_mode) for target_path, (file_path, link_mode) in file_links.items()],
+            WRFRUN.config.get_io_thread_num(),
+        )
 
         if WRFRUN.config.DEBUG_MODE_EXECUTABLE:
             self.before_exec_debug()
@@ -572,34 +1083,24 @@ class ExecutableBase:
             logger.info(f"We are in fake simulation mode, skip saving outputs for '{self.name}'")
             return
 
+        # check all files first, and create each directory only once.
+        file_moves = []
+        save_path_set = set()
         for output_file in self.output_file_config:
-            file_path = output_file["file_path"]
-            save_path = output_file["save_path"]
-            save_name = output_file["save_name"]
-
-            file_path = WRFRUN.config.parse_resource_uri(file_path)
-            save_path = WRFRUN.config.parse_resource_uri(save_path)
-
-            file_path = abspath(file_path)
-            save_path = abspath(save_path)
+            file_path = self._resolve_path(output_file["file_path"])
+            save_path = self._resolve_path(output_file["save_path"])
 
-            if not exists(file_path):
+            if output_file["file_path"] not in self._found_output_files and not exists(file_path):
                 logger.error(f"File not found: '{file_path}'")
                 raise FileNotFoundError(f"File not found: '{file_path}'")
 
-            if not exists(save_path):
-                makedirs(save_path)
+            save_path_set.add(save_path)
+            file_moves.append((file_path, save_path, f"{save_path}/{output_file['save_name']}"))
 
-            target_path = f"{save_path}/{save_name}"
-            if exists(target_path):
-                logger.warning(
-                    (
-                        f"Found existed file, which means you already may have output files in '{save_path}'. "
-                        "If you are saving logs, ignore this warning."
-                    )
-                )
+        for save_path in save_path_set:
+            makedirs(save_path, exist_ok=True)
 
-            move(file_path, target_path)
+        run_file_tasks(_save_output_file, file_moves, WRFRUN.config.get_io_thread_num())
 
         if WRFRUN.config.DEBUG_MODE_EXECUTABLE:
             self.after_exec_debug()
@@ -610,36 +1111,79 @@ class ExecutableBase:
         """
         logger.debug(f"Method 'after_exec_debug' not implemented in '{self.name}'")
 
-    def exec(self):
+    def _get_command(self) -> list[str]:
         """
-        Execute the given command.
+        Build the argument list of the command, including the MPI prefix.
+        The result is cached until ``cmd`` or MPI settings are changed.
+
+        :return: Argument list of the command.
+        :rtype: list
         """
-        work_path = WRFRUN.config.parse_resource_uri(self.work_path)
+        cache_key = (
+            self.cmd if isinstance(self.cmd, str) else tuple(self.cmd),
+            self.mpi_use,
+            self.mpi_cmd,
+            self.mpi_core_num,
+        )
+        if cache_key == self._command_cache_key:
+            return self._command_cache
 
-        if not self.mpi_use or None in [self.mpi_cmd, self.mpi_core_num]:
-            if isinstance(self.cmd, str):
-                self.cmd = [
-                    self.cmd,
-                ]
+        _cmd = shlex.split(self.cmd) if isinstance(self.cmd, str) else list(self.cmd)
 
-            logger.info(f"Running [magenta]{' '.join(self.cmd)}[/] ...")
-            _cmd = self.cmd
+        if self.mpi_use and None not in [self.mpi_cmd, self.mpi_core_num]:
+            _cmd = [self.mpi_cmd, "--oversubscribe", "-np", str(self.mpi_core_num), *_cmd]
 
-        else:
-            logger.info(f"Running [magenta]{self.mpi_cmd} --oversubscribe -np {self.mpi_core_num} {self.cmd}[/] ...")
-            _cmd = [self.mpi_cmd, "--oversubscribe", "-np", str(self.mpi_core_num), self.cmd]
+        self._command_cache = _cmd
+        self._command_cache_key = cache_key
+        return _cmd
+
+    def _prepare_exec(self) -> tuple[list[str], str, str] | None:
+        """
+        Build the command to be executed.
+
+        :return: ``(command, work_path, log_save_prefix)``, or ``None`` if we are in fake simulation mode.
+        :rtype: tuple | None
+        """
+        work_path = self._resolve_path(self.work_path)
+
+        _cmd = self._get_command()
+        logger.info("Running [magenta]%s[/] ...", _LazyJoin(_cmd))
 
         if WRFRUN.config.FAKE_SIMULATION_MODE:
             logger.info(f"We are in fake simulation mode, skip calling numerical model for '{self.name}'")
+            return None
+
+        log_save_path = self._resolve_path(self._log_save_path)
+        return _cmd, work_path, f"{log_save_path}/{self.name}"
+
+    def exec(self):
+        """
+        Execute the given command.
+        """
+        exec_args = self._prepare_exec()
+        if exec_args is None:
             return
 
-        log_save_path = WRFRUN.config.parse_resource_uri(self._log_save_path)
-        log_save_prefix = f"{log_save_path}/{self.name}"
+        _cmd, work_path, log_save_prefix = exec_args
         call_subprocess(_cmd, work_path=work_path, log_save_prefix=log_save_prefix)
 
         if WRFRUN.config.DEBUG_MODE_EXECUTABLE:
             self.exec_debug()
 
+    async def exec_async(self):
+        """
+        Execute the given command without blocking the event loop.
+        """
+        exec_args = self._prepare_exec()
+        if exec_args is None:
+            return
+
+        _cmd, work_path, log_save_prefix = exec_args
+        await call_subprocess_async(_cmd, work_path=work_path, log_save_prefix=log_save_prefix)
+
+        if WRFRUN.config.DEBUG_MODE_EXECUTABLE:
+            self.exec_debug()
+
     def exec_debug(self):
         """
         Debug method that will be called after :py:meth:`exec`.
@@ -657,5 +1201,20 @@ class ExecutableBase:
         if not WRFRUN.config.IS_IN_REPLAY and WRFRUN.config.IS_RECORDING:
             WRFRUN.record.record(self.export_config())
 
+    async def call_async(self):
+        """
+        Asynchronous version of :py:meth:`__call__`, the external program runs without blocking the event loop.
+
+        Independent ``Executable`` can be run at the same time:
+
+        >>> await asyncio.gather(executable_1.call_async(), executable_2.call_async())
+        """
+        self.before_exec()
+        await self.exec_async()
+        self.after_exec()
+
+        if not WRFRUN.config.IS_IN_REPLAY and WRFRUN.config.IS_RECORDING:
+            WRFRUN.record.record(self.export_config())
+
 
-__all__ = ["ExecutableBase", "call_subprocess"]
+__all__ = ["ExecutableBase", "call_subprocess", "call_subprocess_async"]
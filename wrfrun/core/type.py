@@ -41,7 +41,15 @@ class InputFileType(Enum):
     CUSTOM_RES = 2
 
 
-class FileConfigDict(TypedDict):
+class _FileConfigDictOptional(TypedDict, total=False):
+    """
+    Optional keys of :class:`FileConfigDict`.
+    """
+
+    link_mode: str
+
+
+class FileConfigDict(_FileConfigDictOptional):
     """
     This dict is used to store information about the file, including its path,
     the path it will be copied or moved to, its new name, etc.
@@ -72,6 +80,14 @@ class FileConfigDict(TypedDict):
         :type: bool
 
         If the file is model's output. Output file will never be saved to ``.replay`` file.
+
+    .. py:attribute:: link_mode
+        :type: str
+
+        Optional. How an input file is placed in the ``save_path``. Defaults to ``"auto"``.
+
+        * ``"auto"``: Create a hard link, or a reflink copy if it's on another file system. Fall back to a symbolic link.
+        * ``"symlink"``: Always create a symbolic link.
     """
 
     file_path: str
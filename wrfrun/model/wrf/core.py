@@ -308,6 +308,14 @@ class UnGrib(ExecutableBase):
 
         super().__call__()
 
+    async def call_async(self):
+        """
+        Asynchronous version of :py:meth:`__call__`.
+        """
+        self.call_link_grib()
+
+        await super().call_async()
+
 
 class MetGrid(ExecutableBase):
     """
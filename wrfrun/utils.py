@@ -6,6 +6,8 @@ wrfrun.utils
     :toctree: generated/
 
     check_path
+    clone_plain_data
+    run_file_tasks
     rectify_domain_size
     _calculate_domain_shape
     calculate_domain_shape
@@ -15,9 +17,17 @@ wrfrun.utils
 Utility submodule.
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from datetime import date, datetime, time, timedelta
 from os import makedirs
 from os.path import exists
 from shutil import rmtree
+from typing import Any, Callable
+
+# types that can be shared between copies directly.
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None), bytes, datetime, date, time, timedelta)
 
 
 def check_path(*args, force=False):
@@ -36,6 +46,66 @@ def check_path(*args, force=False):
             makedirs(_path)
 
 
+def clone_plain_data(obj: Any) -> Any:
+    """
+    Deep copy plain data, like configs parsed from TOML files and namelist values read by ``f90nml``.
+
+    Dicts (including ``OrderedDict``), lists and tuples are copied recursively, immutable values are returned directly,
+    and values of other types fall back to :func:`copy.deepcopy`.
+    It is much faster than :func:`copy.deepcopy` because plain data is a tree and doesn't need a memo dict.
+
+    :param obj: Data to be copied.
+    :type obj: Any
+    :return: Copy of the data.
+    :rtype: Any
+    """
+    obj_type = type(obj)
+
+    if obj_type is dict:
+        return {key: clone_plain_data(value) for key, value in obj.items()}
+
+    elif obj_type is list:
+        return [clone_plain_data(value) for value in obj]
+
+    elif obj_type is OrderedDict:
+        return OrderedDict((key, clone_plain_data(value)) for key, value in obj.items())
+
+    elif obj_type is tuple:
+        return tuple(clone_plain_data(value) for value in obj)
+
+    elif obj_type in _IMMUTABLE_TYPES:
+        return obj
+
+    else:
+        return deepcopy(obj)
+
+
+def run_file_tasks(func: Callable, tasks: list[tuple], thread_num: int):
+    """
+    Call ``func`` with each argument tuple in ``tasks``.
+
+    File operations like linking, moving and copying spend most of their time waiting for the file system,
+    so they are run in a thread pool when there are more than one of them.
+    Exceptions raised in threads are raised again.
+
+    :param func: Function to be called.
+    :type func: Callable
+    :param tasks: Arguments of each call.
+    :type tasks: list[tuple]
+    :param thread_num: Max number of threads.
+    :type thread_num: int
+    """
+    if len(tasks) < 2 or thread_num < 2:
+        for args in tasks:
+            func(*args)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(thread_num, len(tasks))) as executor:
+        # consume the results to raise exceptions from threads.
+        for _ in executor.map(lambda args: func(*args), tasks):
+            pass
+
+
 def rectify_domain_size(point_num: int, nest_ratio: int) -> int:
     """
     Rectify domain size.
@@ -145,6 +215,8 @@ def check_domain_shape(x_point_num: int, y_point_num: int, nest_ratio: int) -> t
 
 __all__ = [
     "check_path",
+    "clone_plain_data",
+    "run_file_tasks",
     "calculate_domain_shape",
     "rectify_domain_size",
     "check_domain_shape",